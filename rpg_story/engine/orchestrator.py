@@ -50,7 +50,7 @@ class TurnPipeline:
         narrator = self._load_prompt("narrator.txt")
         persona_template = self._load_prompt("npc_persona.txt")
 
-        npc = next((n for n in state.world.npcs if n.npc_id == npc_id), None)
+        npc = state.world.get_npc(npc_id)
         npc_name = npc.name if npc else npc_id
         npc_prof = npc.profession if npc else "unknown"
         npc_traits = ", ".join(npc.traits) if npc else ""
@@ -441,7 +441,7 @@ class TurnPipeline:
         return "{ " + ", ".join(pairs) + " }"
 
     def _npc_personality_brief(self, state: GameState, npc_id: str) -> str:
-        npc = next((n for n in state.world.npcs if n.npc_id == npc_id), None)
+        npc = state.world.get_npc(npc_id)
         if npc is None:
             return "{}"
         payload = {
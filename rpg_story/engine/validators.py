@@ -26,7 +26,7 @@ def is_reachable(graph: Dict[str, Set[str]], start: str, goal: str) -> bool:
     queue = deque([start])
     while queue:
         node = queue.popleft()
-        for neighbor in graph.get(node, set()):
+        for neighbor in graph.get(node, ()):
             if neighbor == goal:
                 return True
             if neighbor not in visited:
@@ -46,8 +46,7 @@ def _validate_npc_move_with_graph(
     world: WorldSpec,
     graph: Dict[str, Set[str]],
 ) -> Tuple[bool, str]:
-    npc_ids = {npc.npc_id for npc in world.npcs}
-    if move.npc_id not in npc_ids:
+    if not any(npc.npc_id == move.npc_id for npc in world.npcs):
         return False, "npc_id not found"
     if move.npc_id not in state.npc_locations:
         return False, "npc_id missing in npc_locations"
@@ -56,8 +55,8 @@ def _validate_npc_move_with_graph(
     if move.from_location != current_loc:
         return False, f"from_location mismatch (expected {current_loc})"
 
-    loc_ids = world.location_ids()
-    if move.to_location not in loc_ids:
+    # build_graph keys every location, so the graph doubles as the location-id set.
+    if move.to_location not in graph:
         return False, "to_location unknown"
 
     if not is_reachable(graph, move.from_location, move.to_location):
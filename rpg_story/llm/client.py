@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 import json
 import os
 import random
@@ -223,7 +224,7 @@ class MockLLMClient(BaseLLMClient):
     """Mock LLM client for tests (offline)."""
 
     def __init__(self, outputs: List[str]) -> None:
-        self.outputs = list(outputs)
+        self.outputs: Deque[str] = deque(outputs)
         self.calls = 0
         self.last_schema_hint: str | None = None
         self.last_response_format: dict | None = None
@@ -240,7 +241,7 @@ class MockLLMClient(BaseLLMClient):
         self.calls += 1
         if not self.outputs:
             raise RuntimeError("MockLLMClient has no more outputs")
-        return self.outputs.pop(0)
+        return self.outputs.popleft()
 
     def generate_json(
         self,
@@ -172,6 +172,12 @@ class WorldSpec(BaseModel):
                 return loc
         return None
 
+    def get_npc(self, npc_id: str) -> Optional[NPCProfile]:
+        for npc in self.npcs:
+            if npc.npc_id == npc_id:
+                return npc
+        return None
+
     def validate_bidirectional_edges(self, strict: bool) -> None:
         """Optionally enforce bidirectional map edges when strict=True."""
         if not strict:
@@ -9,10 +9,12 @@ import re
 from datetime import datetime
 import secrets
 
+from pydantic import ValidationError
+
 from rpg_story.config import AppConfig
 from rpg_story.models.world import GameState
 
-_SAFE_SESSION_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+_SAFE_SESSION_RE = re.compile(r"[A-Za-z0-9_-]+")
 
 
 def validate_session_id(session_id: str) -> None:
@@ -23,7 +25,7 @@ def validate_session_id(session_id: str) -> None:
         raise ValueError("session_id must not contain path separators")
     if ".." in session_id:
         raise ValueError("session_id must not contain '..'")
-    if not _SAFE_SESSION_RE.match(session_id):
+    if not _SAFE_SESSION_RE.fullmatch(session_id):
         raise ValueError("session_id contains invalid characters")
 
 
@@ -61,8 +63,7 @@ def save_state(session_id: str, state: GameState, sessions_root: Path) -> Path:
     session_dir = ensure_session_dir(session_id, sessions_root)
     target = session_dir / "state.json"
     tmp = session_dir / "state.json.tmp"
-    data = state.model_dump()
-    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.write_text(state.model_dump_json(indent=2), encoding="utf-8")
     os.replace(tmp, target)
     return target
 
@@ -73,11 +74,13 @@ def load_state(session_id: str, sessions_root: Path) -> GameState:
     path = get_session_dir(session_id, sessions_root) / "state.json"
     if not path.exists():
         raise FileNotFoundError(f"state.json not found for session_id={session_id}")
+    # Decode and validate in one pass instead of building an intermediate dict.
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"state.json is invalid JSON for session_id={session_id}") from exc
-    return GameState.model_validate(raw)
+        return GameState.model_validate_json(path.read_bytes())
+    except ValidationError as exc:
+        if any(err["type"] == "json_invalid" for err in exc.errors()):
+            raise ValueError(f"state.json is invalid JSON for session_id={session_id}") from exc
+        raise
 
 
 def append_turn_log(session_id: str, record: Dict[str, Any], sessions_root: Path) -> Path:
@@ -97,16 +100,16 @@ def read_turn_logs(session_id: str, sessions_root: Path, limit: int | None = Non
     if not path.exists():
         return []
     results: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
+    # json.loads decodes bytes itself; ValueError also covers lines that are not valid UTF-8.
+    with path.open("rb") as f:
         for line in f:
             if limit is not None and len(results) >= limit:
                 break
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
             try:
                 results.append(json.loads(line))
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
     return results
 
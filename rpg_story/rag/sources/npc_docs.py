@@ -6,7 +6,7 @@ from rpg_story.rag.types import Document, make_doc_id, normalize_metadata
 
 
 def build_npc_profile_doc(world: WorldSpec, npc_id: str, session_id: str) -> Document:
-    npc = next((n for n in world.npcs if n.npc_id == npc_id), None)
+    npc = world.get_npc(npc_id)
     if npc is None:
         text = f"Unknown NPC: {npc_id}"
     else:
@@ -1,12 +1,16 @@
 """World generation pipeline (Milestone 4)."""
 from __future__ import annotations
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Tuple, Any, Dict, List
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 import json
 import math
 import re
+import zlib
 
 from rpg_story.config import AppConfig
 from rpg_story.llm.client import BaseLLMClient, make_json_schema_response_format
@@ -190,15 +194,7 @@ def _summarize_banned_matches(matches: list[dict], limit: int = 4) -> str:
 
 
 def _unique_values(matches: list[dict], key: str) -> list[str]:
-    seen = set()
-    values: list[str] = []
-    for match in matches:
-        value = match.get(key)
-        if not value or value in seen:
-            continue
-        seen.add(value)
-        values.append(str(value))
-    return values
+    return list(dict.fromkeys(str(match.get(key)) for match in matches if match.get(key)))
 
 
 def _detect_prompt_language(world_prompt: str) -> str:
@@ -303,6 +299,14 @@ _NPC_PLACEHOLDER_ZH = re.compile(r"(居民|村民|市民|角色)\s*\d+$")
 _NPC_PLACEHOLDER_EN = re.compile(r"(resident|villager|citizen|character)\s*\d+$", re.IGNORECASE)
 _ITEM_PLACEHOLDER_ZH = re.compile(r"(样本|线索|材料|物资)\s*\d*$")
 _ITEM_PLACEHOLDER_EN = re.compile(r"(sample|clue|material|token)\s*\d*$", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_DIGITS_RE = re.compile(r"\d+$")
+_ZH_GENERIC_TOKENS = ("工作人员", "居民", "市民")
+_EN_GENERIC_TOKENS = ("staff", "resident", "citizen")
+_ZH_TITLE_VERBS = ("寻找", "收集", "采集", "获取", "委托")
+_EN_TITLE_VERBS = ("find", "collect", "gather", "obtain", "fetch", "request")
+_STRONGHOLD_KINDS = frozenset({"castle", "dungeon", "ruin"})
+_VILLAGE_CHIEF_PROFS = frozenset({"村长", "village chief"})
 
 
 def _needs_semantic_polish(world: WorldSpec) -> bool:
@@ -313,7 +317,7 @@ def _needs_semantic_polish(world: WorldSpec) -> bool:
             return True
         prof = str(npc.profession or "").strip().lower()
         kind = loc_kinds.get(npc.starting_location, "")
-        if kind in {"castle", "dungeon", "ruin"} and prof in {"村长", "village chief"}:
+        if kind in _STRONGHOLD_KINDS and prof in _VILLAGE_CHIEF_PROFS:
             return True
     item_names: list[str] = []
     if world.main_quest:
@@ -405,7 +409,7 @@ def create_new_session(
     world_dir = Path(worlds_dir) / session_id
     world_dir.mkdir(parents=True, exist_ok=True)
     world_path = world_dir / "world.json"
-    world_path.write_text(json.dumps(world.model_dump(), ensure_ascii=False, indent=2), encoding="utf-8")
+    world_path.write_text(world.model_dump_json(indent=2), encoding="utf-8")
 
     # persist state
     sessions_dir = sessions_root or cfg.app.sessions_dir
@@ -431,36 +435,29 @@ def _build_initial_quest_journal(world: WorldSpec) -> tuple[dict[str, QuestProgr
     if world.main_quest:
         q = world.main_quest
         main_quest_id = q.quest_id
-        journal[q.quest_id] = QuestProgress(
-            quest_id=q.quest_id,
-            title=q.title,
-            category="main",
-            status="active",
-            objective=q.objective,
-            guidance=q.description,
-            giver_npc_id=q.giver_npc_id,
-            required_items=q.required_items,
-            collected_items={item: 0 for item in q.required_items.keys()},
-            reward_items=q.reward_items,
-            reward_hint=q.reward_hint,
-        )
+        journal[q.quest_id] = _quest_progress_from_spec(q, category="main", status="active")
     for side in world.side_quests:
-        journal[side.quest_id] = QuestProgress(
-            quest_id=side.quest_id,
-            title=side.title,
-            category="side",
-            status="available",
-            objective=side.objective,
-            guidance=side.description,
-            giver_npc_id=side.giver_npc_id,
-            required_items=side.required_items,
-            collected_items={item: 0 for item in side.required_items.keys()},
-            reward_items=side.reward_items,
-            reward_hint=side.reward_hint,
-        )
+        journal[side.quest_id] = _quest_progress_from_spec(side, category="side", status="available")
     return journal, main_quest_id
 
 
+def _quest_progress_from_spec(quest: QuestSpec, *, category: str, status: str) -> QuestProgress:
+    # QuestSpec is already validated, so skip a second validation pass here.
+    return QuestProgress.model_construct(
+        quest_id=quest.quest_id,
+        title=quest.title,
+        category=category,
+        status=status,
+        objective=quest.objective,
+        guidance=quest.description,
+        giver_npc_id=quest.giver_npc_id,
+        required_items=dict(quest.required_items),
+        collected_items=dict.fromkeys(quest.required_items, 0),
+        reward_items=dict(quest.reward_items),
+        reward_hint=quest.reward_hint,
+    )
+
+
 def _ensure_story_structures(world: WorldSpec, target_language: str | None = None) -> WorldSpec:
     updated = world.model_copy(deep=True)
     language = target_language or getattr(updated.world_bible, "narrative_language", None)
@@ -519,25 +516,29 @@ def _default_map_layout(world: WorldSpec) -> list[MapPosition]:
     size = len(world.locations)
     if size == 1:
         return [MapPosition(location_id=world.locations[0].location_id, x=50.0, y=50.0)]
-    nodes: list[MapPosition] = []
-    for idx, loc in enumerate(world.locations):
-        angle = (idx / size) * 6.283185307179586
-        x = 50.0 + 35.0 * math.cos(angle)
-        y = 50.0 + 30.0 * math.sin(angle)
-        nodes.append(MapPosition(location_id=loc.location_id, x=round(x, 2), y=round(y, 2)))
-    return nodes
+    step = math.tau / size
+    return [
+        MapPosition(
+            location_id=loc.location_id,
+            x=round(50.0 + 35.0 * math.cos(idx * step), 2),
+            y=round(50.0 + 30.0 * math.sin(idx * step), 2),
+        )
+        for idx, loc in enumerate(world.locations)
+    ]
 
 
 def _is_chinese_world(world: WorldSpec) -> bool:
     lang = getattr(world.world_bible, "narrative_language", None)
     if lang in {"zh", "en"}:
         return lang == "zh"
-    text = " ".join([world.title or "", world.starting_hook or "", world.initial_quest or ""])
-    return bool(re.search(r"[\u4e00-\u9fff]", text))
+    return any(_contains_cjk(text) for text in (world.title, world.starting_hook, world.initial_quest))
+
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
 
 
 def _contains_cjk(text: str) -> bool:
-    return bool(re.search(r"[\u4e00-\u9fff]", text or ""))
+    return bool(_CJK_RE.search(text or ""))
 
 def _normalize_item_token(value: str) -> str:
     token = re.sub(r"[\s\-]+", "_", str(value or "").strip().lower())
@@ -562,12 +563,14 @@ def _localize_item_map(
     *,
     prefer_chinese: bool,
 ) -> tuple[dict[str, int], dict[str, str]]:
+    if not items:
+        return {}, {}
     localized: dict[str, int] = {}
     renamed: dict[str, str] = {}
     token_to_local: dict[str, str] = {}
     serial = 1
 
-    for raw_name, raw_count in (items or {}).items():
+    for raw_name, raw_count in items.items():
         try:
             count = int(raw_count)
         except Exception:
@@ -590,68 +593,77 @@ def _localize_item_map(
     return localized, renamed
 
 
-def _replace_item_mentions(text: str, replacements: dict[str, str]) -> str:
-    updated = str(text or "")
-    if not updated or not replacements:
-        return updated
+class _ItemMentionReplacer:
+    """Rewrite item mentions using one precompiled pattern shared across texts."""
 
-    pairs = sorted(
-        [(str(src).strip(), str(dst).strip()) for src, dst in replacements.items() if str(src).strip()],
-        key=lambda pair: len(pair[0]),
-        reverse=True,
-    )
-    for src, dst in pairs:
-        if not dst or src == dst:
-            continue
-        variants = {
-            src,
-            src.replace("_", " "),
-            src.replace("-", " "),
-            src.replace(" ", "_"),
-            src.replace(" ", "-"),
-        }
-        token = _normalize_item_token(src)
-        if token:
-            variants.add(token)
-            variants.add(token.replace("_", " "))
-            variants.add(token.replace("_", "-"))
-        for variant in sorted(variants, key=len, reverse=True):
-            if not variant:
+    def __init__(self, replacements: dict[str, str]) -> None:
+        pairs = sorted(
+            [(str(src).strip(), str(dst).strip()) for src, dst in (replacements or {}).items() if str(src).strip()],
+            key=lambda pair: len(pair[0]),
+            reverse=True,
+        )
+        # Case-only duplicates collapse to one alternative; the longest source wins, as before.
+        targets: dict[str, tuple[str, str]] = {}
+        for src, dst in pairs:
+            if not dst or src == dst:
                 continue
-            updated = re.sub(rf"(?<![\w]){re.escape(variant)}(?![\w])", dst, updated, flags=re.IGNORECASE)
-    return updated
+            for variant in _item_name_variants(src):
+                targets.setdefault(variant.lower(), (variant, dst))
+        ordered = sorted(targets.values(), key=lambda pair: len(pair[0]), reverse=True)
+        # Group g<i> maps a match back to its replacement, whatever case folding IGNORECASE applied.
+        self._replacements = tuple(dst for _variant, dst in ordered)
+        self._pattern: re.Pattern[str] | None = None
+        if ordered:
+            body = "|".join(f"(?P<g{idx}>{re.escape(variant)})" for idx, (variant, _dst) in enumerate(ordered))
+            self._pattern = re.compile(rf"(?<![\w])(?:{body})(?![\w])", re.IGNORECASE)
+
+    def apply(self, text: str) -> str:
+        updated = str(text or "")
+        if not updated or self._pattern is None:
+            return updated
+        replacements = self._replacements
+        return self._pattern.sub(lambda m: replacements[int(m.lastgroup[1:])], updated)
+
+
+def _item_name_variants(src: str) -> set[str]:
+    variants = {
+        src,
+        src.replace("_", " "),
+        src.replace("-", " "),
+        src.replace(" ", "_"),
+        src.replace(" ", "-"),
+    }
+    token = _normalize_item_token(src)
+    if token:
+        variants.add(token)
+        variants.add(token.replace("_", " "))
+        variants.add(token.replace("_", "-"))
+    variants.discard("")
+    return variants
+
+
+def _replace_item_mentions_many(texts: list[str], replacements: dict[str, str]) -> list[str]:
+    if not replacements:
+        return [str(text or "") for text in texts]
+    replacer = _ItemMentionReplacer(replacements)
+    return [replacer.apply(text) for text in texts]
 
 
 def _collect_item_pool_from_world(world: WorldSpec) -> list[str]:
-    pool: list[str] = []
+    item_maps: list[dict[str, int]] = []
     for quest in world.side_quests:
-        for item in (quest.required_items or {}).keys():
-            name = str(item or "").strip()
-            if name:
-                pool.append(name)
-        for item in (quest.reward_items or {}).keys():
-            name = str(item or "").strip()
-            if name:
-                pool.append(name)
+        item_maps.append(quest.required_items or {})
+        item_maps.append(quest.reward_items or {})
     if world.main_quest:
-        for item in (world.main_quest.required_items or {}).keys():
-            name = str(item or "").strip()
-            if name:
-                pool.append(name)
-    seen = set()
-    deduped: list[str] = []
-    for name in pool:
-        if name in seen:
-            continue
-        seen.add(name)
-        deduped.append(name)
-    return deduped
+        item_maps.append(world.main_quest.required_items or {})
+    names = (str(item or "").strip() for items in item_maps for item in items)
+    return list(dict.fromkeys(name for name in names if name))
 
 
 def _pick_items_from_pool(pool: list[str], *, seed: str, limit: int = 2) -> dict[str, int]:
     if not pool:
         return {}
-    start = sum(ord(ch) for ch in seed) % len(pool)
+    start = zlib.crc32(seed.encode("utf-8")) % len(pool)
     out: dict[str, int] = {}
     for i in range(min(limit, len(pool))):
         item = pool[(start + i) % len(pool)]
@@ -659,17 +671,24 @@ def _pick_items_from_pool(pool: list[str], *, seed: str, limit: int = 2) -> dict
     return out
 
 
+_SEED_ITEM_SUFFIXES_ZH = ("遗物", "手稿", "矿石", "徽记")
+_SEED_ITEM_SUFFIXES_EN = ("relic", "manuscript", "ore", "insignia")
+
+
 def _seed_item_from_location(loc: Any, *, prefer_chinese: bool, variant: int) -> str:
-    loc_name = str(getattr(loc, "name", "") or "").strip()
+    loc_name = _loc_name(loc)
     loc_kind = str(getattr(loc, "kind", "") or "").strip()
+    return _seed_item_cached(loc_name, loc_kind, prefer_chinese, variant % len(_SEED_ITEM_SUFFIXES_ZH))
+
+
+@lru_cache(maxsize=1024)
+def _seed_item_cached(loc_name: str, loc_kind: str, prefer_chinese: bool, variant: int) -> str:
     base = loc_name or loc_kind or ("地区" if prefer_chinese else "area")
     if prefer_chinese:
-        clean = re.sub(r"\s+", "", base)
-        suffixes = ["遗物", "手稿", "矿石", "徽记"]
-        return f"{clean}{suffixes[variant % len(suffixes)]}"
+        clean = _WHITESPACE_RE.sub("", base)
+        return f"{clean}{_SEED_ITEM_SUFFIXES_ZH[variant]}"
     token = _normalize_item_token(base) or "area"
-    suffixes = ["relic", "manuscript", "ore", "insignia"]
-    return f"{token}_{suffixes[variant % len(suffixes)]}"
+    return f"{token}_{_SEED_ITEM_SUFFIXES_EN[variant]}"
 
 
 def suggest_location_resource_template(world: WorldSpec, loc: Any, *, prefer_chinese: bool) -> dict[str, int]:
@@ -733,6 +752,7 @@ def _normalize_side_quests(world: WorldSpec, *, prefer_chinese: bool) -> list[Qu
         if len(normalized) >= target_count:
             break
         loc = locations[idx % len(locations)] if locations else None
+        loc_name = _loc_name(loc)
         npc = npcs[idx % len(npcs)] if npcs else None
 
         quest_id = str(quest.quest_id or f"side_{idx+1}")
@@ -750,25 +770,26 @@ def _normalize_side_quests(world: WorldSpec, *, prefer_chinese: bool) -> list[Qu
             reward_items = _pick_reward(idx, loc)
         reward_items, reward_replacements = _localize_item_map(reward_items, prefer_chinese=prefer_chinese)
 
-        text_replacements = dict(required_replacements)
-        text_replacements.update(reward_replacements)
+        text_replacements = {**required_replacements, **reward_replacements}
 
-        objective_text = quest.objective or _default_side_objective(required_items, loc, prefer_chinese)
-        description_text = quest.description or _default_side_description(loc, prefer_chinese)
+        objective_text = quest.objective or _default_side_objective(required_items, loc_name, prefer_chinese)
+        description_text = quest.description or _default_side_description(loc_name, prefer_chinese)
         reward_hint_text = quest.reward_hint or _default_reward_hint(reward_items, prefer_chinese)
 
-        objective_text = _replace_item_mentions(objective_text, text_replacements)
-        description_text = _replace_item_mentions(description_text, text_replacements)
-        reward_hint_text = _replace_item_mentions(reward_hint_text, text_replacements)
+        objective_text, description_text, reward_hint_text = _replace_item_mentions_many(
+            [objective_text, description_text, reward_hint_text],
+            text_replacements,
+        )
 
         objective_text = _ensure_side_objective_consistency(
             objective_text,
             required_items,
-            loc,
+            loc_name,
             prefer_chinese=prefer_chinese,
         )
+        title_label = loc_name or (loc.location_id if loc else "") or f"loc_{idx+1}"
         title_text = _ensure_side_title_consistency(
-            quest.title or _default_side_title(loc, idx, prefer_chinese),
+            quest.title or _default_side_title(title_label, prefer_chinese),
             required_items,
             prefer_chinese=prefer_chinese,
         )
@@ -791,6 +812,7 @@ def _normalize_side_quests(world: WorldSpec, *, prefer_chinese: bool) -> list[Qu
     while len(normalized) < target_count and locations:
         idx = len(normalized)
         loc = locations[idx % len(locations)]
+        loc_name = _loc_name(loc)
         npc = npcs[idx % len(npcs)] if npcs else None
         required_items = _default_required_items_for_location(loc, prefer_chinese=prefer_chinese, variant=idx)
         reward_items = _pick_reward(idx, loc)
@@ -803,10 +825,10 @@ def _normalize_side_quests(world: WorldSpec, *, prefer_chinese: bool) -> list[Qu
         normalized.append(
             QuestSpec(
                 quest_id=quest_id,
-                title=_default_side_title(loc, idx, prefer_chinese),
+                title=_default_side_title(loc_name or loc.location_id or f"loc_{idx+1}", prefer_chinese),
                 category="side",
-                description=_default_side_description(loc, prefer_chinese),
-                objective=_default_side_objective(required_items, loc, prefer_chinese),
+                description=_default_side_description(loc_name, prefer_chinese),
+                objective=_default_side_objective(required_items, loc_name, prefer_chinese),
                 giver_npc_id=npc.npc_id if npc else None,
                 suggested_location=loc.location_id,
                 required_items=required_items,
@@ -831,15 +853,17 @@ def _default_required_items_for_location(
     return result
 
 
-def _default_side_title(loc: Any, idx: int, prefer_chinese: bool) -> str:
-    loc_name = str(getattr(loc, "name", "") or "").strip() or str(getattr(loc, "location_id", "") or f"loc_{idx+1}")
+def _loc_name(loc: Any) -> str:
+    return str(getattr(loc, "name", "") or "").strip()
+
+
+def _default_side_title(loc_label: str, prefer_chinese: bool) -> str:
     if prefer_chinese:
-        return f"{loc_name}委托"
-    return f"{loc_name} Request"
+        return f"{loc_label}委托"
+    return f"{loc_label} Request"
 
 
-def _default_side_description(loc: Any, prefer_chinese: bool) -> str:
-    loc_name = str(getattr(loc, "name", "") or "").strip() if loc is not None else ""
+def _default_side_description(loc_name: str, prefer_chinese: bool) -> str:
     if prefer_chinese:
         if loc_name:
             return f"前往{loc_name}并完成该地点委托所需的物资准备。"
@@ -849,9 +873,8 @@ def _default_side_description(loc: Any, prefer_chinese: bool) -> str:
     return "Travel to the target location and prepare the required materials."
 
 
-def _default_side_objective(required_items: dict[str, int], loc: Any, prefer_chinese: bool) -> str:
+def _default_side_objective(required_items: dict[str, int], loc_name: str, prefer_chinese: bool) -> str:
     req = "，".join([f"{name} x{count}" for name, count in required_items.items()])
-    loc_name = str(getattr(loc, "name", "") or "").strip() if loc is not None else ""
     if prefer_chinese:
         if loc_name:
             return f"在{loc_name}收集并交付：{req}"
@@ -864,7 +887,7 @@ def _default_side_objective(required_items: dict[str, int], loc: Any, prefer_chi
 def _ensure_side_objective_consistency(
     objective_text: str,
     required_items: dict[str, int],
-    loc: Any,
+    loc_name: str,
     *,
     prefer_chinese: bool,
 ) -> str:
@@ -872,10 +895,8 @@ def _ensure_side_objective_consistency(
     if not required_items:
         return text
     if not text:
-        return _default_side_objective(required_items, loc, prefer_chinese)
-    item_names = [str(name) for name in required_items.keys()]
-    mentions_any = any(name and name in text for name in item_names)
-    if mentions_any:
+        return _default_side_objective(required_items, loc_name, prefer_chinese)
+    if _any_mentioned(text, tuple(required_items)):
         return text
     req = "，".join([f"{name} x{count}" for name, count in required_items.items()])
     if prefer_chinese:
@@ -887,22 +908,35 @@ def _ensure_side_title_consistency(title: str, required_items: dict[str, int], *
     text = str(title or "").strip()
     if not text:
         return text
-    if not required_items:
+    item_names = tuple(required_items)
+    if not item_names:
         return text
-    first_item = next(iter(required_items.keys()))
-    mentions_any = any(str(name) in text for name in required_items.keys())
-    if mentions_any:
+    if _any_mentioned(text, item_names):
         return text
+    first_item = item_names[0]
     if prefer_chinese:
-        if any(token in text for token in ("寻找", "收集", "采集", "获取", "委托")):
+        if any(token in text for token in _ZH_TITLE_VERBS):
             return f"收集{first_item}"
         return text
     lower = text.lower()
-    if any(token in lower for token in ("find", "collect", "gather", "obtain", "fetch", "request")):
+    if any(token in lower for token in _EN_TITLE_VERBS):
         return f"Collect {first_item}"
     return text
 
 
+@lru_cache(maxsize=512)
+def _mention_pattern(names: tuple[str, ...]) -> re.Pattern[str] | None:
+    parts = sorted({name for name in names if name}, key=len, reverse=True)
+    if not parts:
+        return None
+    return re.compile("|".join(re.escape(name) for name in parts))
+
+
+def _any_mentioned(text: str, names: tuple[str, ...]) -> bool:
+    pattern = _mention_pattern(names)
+    return pattern is not None and pattern.search(text) is not None
+
+
 def _default_reward_hint(reward_items: dict[str, int], prefer_chinese: bool) -> str:
     req = "，".join([f"{name} x{count}" for name, count in reward_items.items()])
     if prefer_chinese:
@@ -914,12 +948,15 @@ def _aggregate_side_rewards(side_quests: list[QuestSpec]) -> dict[str, int]:
     required: dict[str, int] = {}
     for quest in side_quests:
         for item, count in (quest.reward_items or {}).items():
-            required[item] = max(required.get(item, 0), int(count))
+            amount = int(count)
+            current = required.get(item)
+            if current is None or amount > current:
+                required[item] = amount
     return required
 
 
 def _normalize_npc_professions(world: WorldSpec, *, prefer_chinese: bool) -> list[NPCProfile]:
-    npcs = [npc.model_copy(deep=True) for npc in world.npcs]
+    npcs = [npc.model_copy() for npc in world.npcs]
     if not npcs:
         return npcs
     loc_map = {loc.location_id: loc for loc in world.locations}
@@ -970,52 +1007,46 @@ def _profession_seed_pool(world: WorldSpec, *, prefer_chinese: bool) -> list[str
     return ["Resident", "Staff"]
 
 
+_KIND_TO_PROFESSION: dict[str, tuple[str, str]] = {
+    "castle": ("守卫", "Guard"),
+    "fort": ("守卫", "Guard"),
+    "stronghold": ("守卫", "Guard"),
+    "forest": ("巡林员", "Ranger"),
+    "woods": ("巡林员", "Ranger"),
+    "town": ("市民", "Citizen"),
+    "village": ("市民", "Citizen"),
+    "city": ("市民", "Citizen"),
+    "library": ("馆员", "Librarian"),
+    "dungeon": ("探查员", "Scout"),
+    "ruin": ("探查员", "Scout"),
+}
+_DEFAULT_PROFESSION = ("工作人员", "Staff")
+
+
 def _profession_from_location(loc: Any, *, prefer_chinese: bool) -> str:
     kind = str(getattr(loc, "kind", "") or "").strip().lower()
-    loc_name = str(getattr(loc, "name", "") or "").strip()
-    if prefer_chinese:
-        if kind in {"castle", "fort", "stronghold"}:
-            return "守卫"
-        if kind in {"forest", "woods"}:
-            return "巡林员"
-        if kind in {"town", "village", "city"}:
-            return "市民"
-        if kind in {"library"}:
-            return "馆员"
-        if kind in {"dungeon", "ruin"}:
-            return "探查员"
-        return "工作人员"
-    if kind in {"castle", "fort", "stronghold"}:
-        return "Guard"
-    if kind in {"forest", "woods"}:
-        return "Ranger"
-    if kind in {"town", "village", "city"}:
-        return "Citizen"
-    if kind in {"library"}:
-        return "Librarian"
-    if kind in {"dungeon", "ruin"}:
-        return "Scout"
-    return "Staff"
+    zh, en = _KIND_TO_PROFESSION.get(kind, _DEFAULT_PROFESSION)
+    return zh if prefer_chinese else en
 
 
 def _clean_npc_profession(text: str, *, loc: Any, npc_name: str, prefer_chinese: bool) -> str:
     raw = str(text or "").strip()
     if not raw:
         return ""
-    loc_name = str(getattr(loc, "name", "") or "").strip()
+    loc_name = _loc_name(loc)
     lowered = raw.lower()
 
     if loc_name:
         raw = raw.replace(loc_name, "").strip()
         lowered = raw.lower()
 
-    raw = re.sub(r"\s+", " ", raw).strip(" -_·")
+    raw = _WHITESPACE_RE.sub(" ", raw).strip(" -_·")
     lowered = raw.lower()
     if not raw:
         return ""
     if raw == npc_name:
         return ""
-    if re.search(r"\d+$", raw):
+    if _TRAILING_DIGITS_RE.search(raw):
         return ""
     if _NPC_PLACEHOLDER_ZH.search(raw) or _NPC_PLACEHOLDER_EN.search(raw):
         return ""
@@ -1028,34 +1059,38 @@ def _clean_npc_profession(text: str, *, loc: Any, npc_name: str, prefer_chinese:
 
 def _ensure_npc_density(world: WorldSpec, *, prefer_chinese: bool) -> list[NPCProfile]:
     locations = list(world.locations)
-    npcs = [npc.model_copy(deep=True) for npc in world.npcs]
+    npcs = [npc.model_copy() for npc in world.npcs]
     if not locations:
         return npcs
 
-    by_loc: dict[str, list[NPCProfile]] = {loc.location_id: [] for loc in locations}
+    loc_ids = frozenset(loc.location_id for loc in locations)
+    by_loc: defaultdict[str, list[NPCProfile]] = defaultdict(list)
     for npc in npcs:
-        if npc.starting_location in by_loc:
-            by_loc[npc.starting_location].append(npc)
-        else:
+        if npc.starting_location not in loc_ids:
             npc.starting_location = world.starting_location
-            by_loc.setdefault(world.starting_location, []).append(npc)
+        by_loc[npc.starting_location].append(npc)
 
     target_min = 1
     target_max = 5
     profession_pool = _profession_seed_pool(world, prefer_chinese=prefer_chinese)
     trait_sets = _generic_trait_sets(prefer_chinese=prefer_chinese)
 
-    used_ids = {npc.npc_id for npc in npcs}
-    serial_id = 1
+    auto_prefix = "npc_auto_"
+    # Start past the highest existing auto id so every generated id is fresh.
+    serial_id = 1 + max(
+        (
+            int(npc.npc_id[len(auto_prefix):])
+            for npc in npcs
+            if npc.npc_id.startswith(auto_prefix) and npc.npc_id[len(auto_prefix):].isdecimal()
+        ),
+        default=0,
+    )
 
     def next_id() -> str:
         nonlocal serial_id
-        while True:
-            candidate = f"npc_auto_{serial_id:03d}"
-            serial_id += 1
-            if candidate not in used_ids:
-                used_ids.add(candidate)
-                return candidate
+        candidate = f"{auto_prefix}{serial_id:03d}"
+        serial_id += 1
+        return candidate
 
     for loc in locations:
         current = by_loc.get(loc.location_id, [])
@@ -1065,7 +1100,7 @@ def _ensure_npc_density(world: WorldSpec, *, prefer_chinese: bool) -> list[NPCPr
         by_loc[loc.location_id] = current[:target_max]
 
     for loc in locations:
-        current = by_loc.get(loc.location_id, [])
+        current = by_loc[loc.location_id]
         while len(current) < target_min:
             idx = len(npcs)
             traits, goals, obedience, stubborn, risk, disp, refusal = trait_sets[idx % len(trait_sets)]
@@ -1086,39 +1121,31 @@ def _ensure_npc_density(world: WorldSpec, *, prefer_chinese: bool) -> list[NPCPr
             npcs.append(profile)
             current.append(profile)
 
-    result: list[NPCProfile] = []
-    seen = set()
-    for loc in locations:
-        for npc in by_loc.get(loc.location_id, []):
-            if npc.npc_id in seen:
-                continue
-            seen.add(npc.npc_id)
-            result.append(npc)
-    for npc in npcs:
-        if npc.npc_id in seen:
-            continue
-        seen.add(npc.npc_id)
-        result.append(npc)
-    return result
+    # Location order first, then any leftovers; the first NPC seen per id wins.
+    ordered = chain(chain.from_iterable(by_loc.get(loc.location_id, ()) for loc in locations), npcs)
+    result: dict[str, NPCProfile] = {}
+    for npc in ordered:
+        result.setdefault(npc.npc_id, npc)
+    return list(result.values())
 
 
 def _ensure_unique_npc_names(world: WorldSpec, npcs: list[NPCProfile], *, prefer_chinese: bool) -> list[NPCProfile]:
-    loc_map = {loc.location_id: loc for loc in world.locations}
+    loc_names = {loc.location_id: str(loc.name or "").strip() for loc in world.locations}
     used: set[str] = set()
-    per_loc_counter: dict[str, int] = {}
+    suffix_counter: dict[str, int] = {}
     normalized: list[NPCProfile] = []
 
     for npc in npcs:
-        profile = npc.model_copy(deep=True)
+        profile = npc.model_copy()
         current_name = str(profile.name or "").strip()
-        loc = loc_map.get(profile.starting_location)
+        loc_name = loc_names.get(profile.starting_location, "")
         if (
             current_name
             and current_name not in used
             and not _npc_name_needs_rewrite(
                 current_name,
                 profession=str(profile.profession or "").strip(),
-                loc=loc,
+                loc_name=loc_name,
                 prefer_chinese=prefer_chinese,
             )
         ):
@@ -1126,7 +1153,7 @@ def _ensure_unique_npc_names(world: WorldSpec, npcs: list[NPCProfile], *, prefer
             normalized.append(profile)
             continue
 
-        loc_name = str(getattr(loc, "name", "") or "").strip() or profile.starting_location or "loc"
+        loc_name = loc_name or profile.starting_location or "loc"
         role = str(profile.profession or "").strip() or (
             "角色" if prefer_chinese else "Character"
         )
@@ -1136,12 +1163,13 @@ def _ensure_unique_npc_names(world: WorldSpec, npcs: list[NPCProfile], *, prefer
             profession=role,
             prefer_chinese=prefer_chinese,
         )
-        count = per_loc_counter.get(profile.starting_location, 0) + 1
-        candidate = base if base not in used else (f"{base}{count}" if prefer_chinese else f"{base} {count}")
+        # Resume numbering per base name so repeated bases do not re-probe from 1.
+        count = suffix_counter.get(base, 0)
+        candidate = base
         while candidate in used:
             count += 1
             candidate = f"{base}{count}" if prefer_chinese else f"{base} {count}"
-        per_loc_counter[profile.starting_location] = count
+        suffix_counter[base] = count
         profile.name = candidate
         used.add(candidate)
         normalized.append(profile)
@@ -1149,13 +1177,12 @@ def _ensure_unique_npc_names(world: WorldSpec, npcs: list[NPCProfile], *, prefer
     return normalized
 
 
-def _npc_name_needs_rewrite(name: str, *, profession: str, loc: Any, prefer_chinese: bool) -> bool:
+def _npc_name_needs_rewrite(name: str, *, profession: str, loc_name: str, prefer_chinese: bool) -> bool:
     text = str(name or "").strip()
     if not text:
         return True
     if _NPC_PLACEHOLDER_ZH.search(text) or _NPC_PLACEHOLDER_EN.search(text):
         return True
-    loc_name = str(getattr(loc, "name", "") or "").strip()
     prof = str(profession or "").strip()
     if prof and text == prof:
         return True
@@ -1163,31 +1190,31 @@ def _npc_name_needs_rewrite(name: str, *, profession: str, loc: Any, prefer_chin
         return True
     if prof and loc_name and text == f"{loc_name}{prof}":
         return True
-    if prefer_chinese and any(token in text for token in ("工作人员", "居民", "市民")) and len(text) >= 6:
+    if prefer_chinese and any(token in text for token in _ZH_GENERIC_TOKENS) and len(text) >= 6:
         return True
-    if (not prefer_chinese) and any(token in text.lower() for token in ("staff", "resident", "citizen")) and len(text) >= 12:
+    if (not prefer_chinese) and any(token in text.lower() for token in _EN_GENERIC_TOKENS) and len(text) >= 12:
         return True
     return False
 
 
+_NAME_FALLBACK_CHARS_ZH = tuple("安若清宁泽岚川言")
+_NAME_CONSONANTS_EN = ("b", "d", "f", "g", "k", "l", "m", "n", "r", "s", "t", "v")
+_NAME_VOWELS_EN = ("a", "e", "i", "o", "u", "y")
+
+
 def _procedural_npc_name(*, seed: str, loc_name: str, profession: str, prefer_chinese: bool) -> str:
-    score = 0
-    for idx, ch in enumerate(seed):
-        score += (idx + 1) * ord(ch)
+    score = zlib.crc32(seed.encode("utf-8"))
     if prefer_chinese:
-        loc_chars = [ch for ch in str(loc_name or "") if _contains_cjk(ch)]
-        prof_chars = [ch for ch in str(profession or "") if _contains_cjk(ch)]
-        fallback = list("安若清宁泽岚川言")
-        pool = loc_chars + prof_chars + fallback
-        if not pool:
-            pool = fallback
+        loc_chars = _CJK_RE.findall(str(loc_name or ""))
+        prof_chars = _CJK_RE.findall(str(profession or ""))
+        pool = [*loc_chars, *prof_chars, *_NAME_FALLBACK_CHARS_ZH]
         first = pool[score % len(pool)]
         second = pool[(score // 3 + 1) % len(pool)]
         if first == second:
             second = pool[(score // 5 + 2) % len(pool)]
         return f"{first}{second}"
-    consonants = ["b", "d", "f", "g", "k", "l", "m", "n", "r", "s", "t", "v"]
-    vowels = ["a", "e", "i", "o", "u", "y"]
+    consonants = _NAME_CONSONANTS_EN
+    vowels = _NAME_VOWELS_EN
     c1 = consonants[score % len(consonants)]
     v1 = vowels[(score // 2) % len(vowels)]
     c2 = consonants[(score // 5 + 3) % len(consonants)]
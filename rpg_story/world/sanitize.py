@@ -1,75 +1,99 @@
 """Sanitize/normalize world payloads from LLMs before strict validation."""
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Tuple
 import re
 
-WORLD_FIELDS = {
-    "world_id",
-    "title",
-    "world_bible",
-    "locations",
-    "npcs",
-    "starting_location",
-    "starting_hook",
-    "initial_quest",
-    "main_quest",
-    "side_quests",
-    "map_layout",
-}
-
-WORLD_BIBLE_FIELDS = {
-    "tech_level",
-    "narrative_language",
-    "magic_rules",
-    "tone",
-    "anachronism_policy",
-    "taboos",
-    "do_not_mention",
-    "anachronism_blocklist",
-}
-
-LOCATION_FIELDS = {
-    "location_id",
-    "name",
-    "kind",
-    "description",
-    "connected_to",
-    "tags",
-}
-
-NPC_FIELDS = {
-    "npc_id",
-    "name",
-    "profession",
-    "traits",
-    "goals",
-    "starting_location",
-    "obedience_level",
-    "stubbornness",
-    "risk_tolerance",
-    "disposition_to_player",
-    "refusal_style",
-}
+from rpg_story.world.term_guard import fold_case
+
+WORLD_FIELDS = frozenset(
+    {
+        "world_id",
+        "title",
+        "world_bible",
+        "locations",
+        "npcs",
+        "starting_location",
+        "starting_hook",
+        "initial_quest",
+        "main_quest",
+        "side_quests",
+        "map_layout",
+    }
+)
+
+WORLD_BIBLE_FIELDS = frozenset(
+    {
+        "tech_level",
+        "narrative_language",
+        "magic_rules",
+        "tone",
+        "anachronism_policy",
+        "taboos",
+        "do_not_mention",
+        "anachronism_blocklist",
+    }
+)
+
+LOCATION_FIELDS = frozenset(
+    {
+        "location_id",
+        "name",
+        "kind",
+        "description",
+        "connected_to",
+        "tags",
+    }
+)
+
+NPC_FIELDS = frozenset(
+    {
+        "npc_id",
+        "name",
+        "profession",
+        "traits",
+        "goals",
+        "starting_location",
+        "obedience_level",
+        "stubbornness",
+        "risk_tolerance",
+        "disposition_to_player",
+        "refusal_style",
+    }
+)
+
+QUEST_FIELDS = frozenset(
+    {
+        "quest_id",
+        "title",
+        "category",
+        "description",
+        "objective",
+        "giver_npc_id",
+        "suggested_location",
+        "required_items",
+        "reward_items",
+        "reward_hint",
+    }
+)
 
-QUEST_FIELDS = {
-    "quest_id",
-    "title",
-    "category",
-    "description",
-    "objective",
-    "giver_npc_id",
-    "suggested_location",
-    "required_items",
-    "reward_items",
-    "reward_hint",
-}
+MAP_LAYOUT_FIELDS = frozenset(
+    {
+        "location_id",
+        "x",
+        "y",
+    }
+)
 
-MAP_LAYOUT_FIELDS = {
-    "location_id",
-    "x",
-    "y",
-}
+_WB_LIST_FIELDS = frozenset({"taboos", "do_not_mention", "anachronism_blocklist"})
+_LOC_LIST_FIELDS = frozenset({"connected_to", "tags"})
+_NPC_LIST_FIELDS = frozenset({"traits", "goals"})
+_NPC_UNIT_FIELDS = frozenset({"obedience_level", "stubbornness", "risk_tolerance"})
+_QUEST_ITEM_FIELDS = frozenset({"required_items", "reward_items"})
+_MAP_COORD_FIELDS = frozenset({"x", "y"})
 
 LEVEL_MAP = {
     "low": 0.2,
@@ -98,26 +122,59 @@ DISPOSITION_KEYWORDS = {
     "ally": 4,
 }
 
-SCRUB_TEXT_FIELDS = {
-    "title",
-    "starting_hook",
-    "initial_quest",
+_NARR_LANG_MAP = {
+    "zh": "zh",
+    "zh-cn": "zh",
+    "zh_hans": "zh",
+    "chinese": "zh",
+    "中文": "zh",
+    "cn": "zh",
+    "en": "en",
+    "en-us": "en",
+    "english": "en",
+    "英文": "en",
 }
 
-SCRUB_WORLD_BIBLE_TEXT_FIELDS = {"tech_level", "magic_rules", "tone"}
-SCRUB_WORLD_BIBLE_LIST_FIELDS = {"taboos", "do_not_mention", "anachronism_blocklist"}
-SCRUB_LOCATION_TEXT_FIELDS = {"name", "kind", "description"}
-SCRUB_LOCATION_LIST_FIELDS = {"tags"}
-SCRUB_NPC_TEXT_FIELDS = {"name", "profession", "refusal_style"}
-SCRUB_NPC_LIST_FIELDS = {"traits", "goals"}
-SCRUB_QUEST_TEXT_FIELDS = {"title", "description", "objective", "reward_hint"}
+# Longest keywords first so "very hostile" is matched whole, not also as "hostile".
+_DISP_RE = re.compile("|".join(re.escape(key) for key in sorted(DISPOSITION_KEYWORDS, key=len, reverse=True)))
+
+SCRUB_TEXT_FIELDS = frozenset(
+    {
+        "title",
+        "starting_hook",
+        "initial_quest",
+    }
+)
+
+SCRUB_WORLD_BIBLE_TEXT_FIELDS = frozenset({"tech_level", "magic_rules", "tone"})
+SCRUB_WORLD_BIBLE_LIST_FIELDS = frozenset({"taboos", "do_not_mention", "anachronism_blocklist"})
+SCRUB_LOCATION_TEXT_FIELDS = frozenset({"name", "kind", "description"})
+SCRUB_LOCATION_LIST_FIELDS = frozenset({"tags"})
+SCRUB_NPC_TEXT_FIELDS = frozenset({"name", "profession", "refusal_style"})
+SCRUB_NPC_LIST_FIELDS = frozenset({"traits", "goals"})
+SCRUB_QUEST_TEXT_FIELDS = frozenset({"title", "description", "objective", "reward_hint"})
+
+_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+@dataclass(frozen=True)
+class _BannedPatterns:
+    terms: Tuple[str, ...]
+    # None when the blocklist had no usable terms.
+    combined: re.Pattern[str] | None
+    # Casefolded first word of each term, for the substring prefilter.
+    probes: Tuple[str, ...]
+
+
+_NO_BANNED = _BannedPatterns(terms=(), combined=None, probes=())
 
 
 def summarize_changes(changes: List[str], limit: int = 12) -> str:
-    if not changes:
+    total = len(changes)
+    if not total:
         return "none"
-    if len(changes) > limit:
-        return "; ".join(changes[:limit]) + f"; +{len(changes) - limit} more"
+    if total > limit:
+        return "; ".join(islice(changes, limit)) + f"; +{total - limit} more"
     return "; ".join(changes)
 
 
@@ -136,60 +193,27 @@ def sanitize_world_payload(data: Any) -> Tuple[Any, List[str]]:
 
     world_bible = cleaned.get("world_bible")
     if isinstance(world_bible, dict):
-        cleaned_bible: Dict[str, Any] = {}
-        for key, value in world_bible.items():
-            if key in WORLD_BIBLE_FIELDS:
-                if key in {"taboos", "do_not_mention", "anachronism_blocklist"}:
-                    cleaned_bible[key] = _coerce_str_list(value)
-                elif key == "narrative_language":
-                    cleaned_bible[key] = _normalize_narrative_language(value, changes, f"world_bible.{key}")
-                else:
-                    cleaned_bible[key] = value
-            else:
-                changes.append(f"drop_world_bible:{key}")
-        cleaned["world_bible"] = cleaned_bible
+        cleaned["world_bible"] = _clean_fields(
+            world_bible, _WORLD_BIBLE_HANDLERS, changes, "world_bible", "drop_world_bible"
+        )
 
     locations = cleaned.get("locations")
     if isinstance(locations, list):
-        cleaned_locations: List[Any] = []
-        for idx, loc in enumerate(locations):
-            if not isinstance(loc, dict):
-                cleaned_locations.append(loc)
-                continue
-            loc_clean: Dict[str, Any] = {}
-            for key, value in loc.items():
-                if key in LOCATION_FIELDS:
-                    if key in {"connected_to", "tags"}:
-                        loc_clean[key] = _coerce_str_list(value)
-                    else:
-                        loc_clean[key] = value
-                else:
-                    changes.append(f"drop_location[{idx}]:{key}")
-            cleaned_locations.append(loc_clean)
-        cleaned["locations"] = cleaned_locations
+        cleaned["locations"] = [
+            _clean_fields(loc, _LOCATION_HANDLERS, changes, f"locations[{idx}]", f"drop_location[{idx}]")
+            if isinstance(loc, dict)
+            else loc
+            for idx, loc in enumerate(locations)
+        ]
 
     npcs = cleaned.get("npcs")
     if isinstance(npcs, list):
-        cleaned_npcs: List[Any] = []
-        for idx, npc in enumerate(npcs):
-            if not isinstance(npc, dict):
-                cleaned_npcs.append(npc)
-                continue
-            npc_clean: Dict[str, Any] = {}
-            for key, value in npc.items():
-                if key in NPC_FIELDS:
-                    if key in {"traits", "goals"}:
-                        npc_clean[key] = _coerce_str_list(value)
-                    elif key in {"obedience_level", "stubbornness", "risk_tolerance"}:
-                        npc_clean[key] = _normalize_unit(value, changes, f"npcs[{idx}].{key}")
-                    elif key == "disposition_to_player":
-                        npc_clean[key] = _normalize_disposition(value, changes, f"npcs[{idx}].{key}")
-                    else:
-                        npc_clean[key] = value
-                else:
-                    changes.append(f"drop_npc[{idx}]:{key}")
-            cleaned_npcs.append(npc_clean)
-        cleaned["npcs"] = cleaned_npcs
+        cleaned["npcs"] = [
+            _clean_fields(npc, _NPC_HANDLERS, changes, f"npcs[{idx}]", f"drop_npc[{idx}]")
+            if isinstance(npc, dict)
+            else npc
+            for idx, npc in enumerate(npcs)
+        ]
 
     main_quest = cleaned.get("main_quest")
     if isinstance(main_quest, dict):
@@ -197,32 +221,19 @@ def sanitize_world_payload(data: Any) -> Tuple[Any, List[str]]:
 
     side_quests = cleaned.get("side_quests")
     if isinstance(side_quests, list):
-        cleaned_side_quests: List[Any] = []
-        for idx, quest in enumerate(side_quests):
-            if not isinstance(quest, dict):
-                cleaned_side_quests.append(quest)
-                continue
-            cleaned_side_quests.append(_sanitize_quest(quest, changes, f"side_quests[{idx}]"))
-        cleaned["side_quests"] = cleaned_side_quests
+        cleaned["side_quests"] = [
+            _sanitize_quest(quest, changes, f"side_quests[{idx}]") if isinstance(quest, dict) else quest
+            for idx, quest in enumerate(side_quests)
+        ]
 
     map_layout = cleaned.get("map_layout")
     if isinstance(map_layout, list):
-        cleaned_layout: List[Any] = []
-        for idx, node in enumerate(map_layout):
-            if not isinstance(node, dict):
-                cleaned_layout.append(node)
-                continue
-            node_clean: Dict[str, Any] = {}
-            for key, value in node.items():
-                if key in MAP_LAYOUT_FIELDS:
-                    if key in {"x", "y"}:
-                        node_clean[key] = _to_float(value)
-                    else:
-                        node_clean[key] = value
-                else:
-                    changes.append(f"drop_map_layout[{idx}]:{key}")
-            cleaned_layout.append(node_clean)
-        cleaned["map_layout"] = cleaned_layout
+        cleaned["map_layout"] = [
+            _clean_fields(node, _MAP_LAYOUT_HANDLERS, changes, f"map_layout[{idx}]", f"drop_map_layout[{idx}]")
+            if isinstance(node, dict)
+            else node
+            for idx, node in enumerate(map_layout)
+        ]
 
     return cleaned, changes
 
@@ -233,91 +244,97 @@ def scrub_banned_terms(data: Any, banned: List[str]) -> Tuple[Any, List[str]]:
         changes.append("scrub_skip_non_dict")
         return data, changes
 
-    patterns = _build_banned_patterns(banned)
-    cleaned = dict(data)
+    patterns = _build_banned_patterns(tuple(banned))
+    # Containers are copied only on the path to a changed field; clean ones are shared.
+    updates: Dict[str, Any] = {}
+    top = _scrub_fields(data, SCRUB_TEXT_FIELDS, (), "", patterns, changes)
+    if top is not data:
+        updates.update((field, top[field]) for field in SCRUB_TEXT_FIELDS if field in top)
 
-    for field in SCRUB_TEXT_FIELDS:
-        if isinstance(cleaned.get(field), str):
-            cleaned[field] = _scrub_text(cleaned[field], field, patterns, changes)
-
-    world_bible = cleaned.get("world_bible")
+    world_bible = data.get("world_bible")
     if isinstance(world_bible, dict):
-        bible_clean = dict(world_bible)
-        for field in SCRUB_WORLD_BIBLE_TEXT_FIELDS:
-            if isinstance(bible_clean.get(field), str):
-                bible_clean[field] = _scrub_text(bible_clean[field], f"world_bible.{field}", patterns, changes)
-        for field in SCRUB_WORLD_BIBLE_LIST_FIELDS:
-            if isinstance(bible_clean.get(field), list):
-                bible_clean[field] = _scrub_list(bible_clean[field], f"world_bible.{field}", patterns, changes)
-        cleaned["world_bible"] = bible_clean
-
-    locations = cleaned.get("locations")
-    if isinstance(locations, list):
-        new_locations: List[Any] = []
-        for idx, loc in enumerate(locations):
-            if not isinstance(loc, dict):
-                new_locations.append(loc)
-                continue
-            loc_clean = dict(loc)
-            for field in SCRUB_LOCATION_TEXT_FIELDS:
-                if isinstance(loc_clean.get(field), str):
-                    loc_clean[field] = _scrub_text(
-                        loc_clean[field], f"locations[{idx}].{field}", patterns, changes
-                    )
-            for field in SCRUB_LOCATION_LIST_FIELDS:
-                if isinstance(loc_clean.get(field), list):
-                    loc_clean[field] = _scrub_list(
-                        loc_clean[field], f"locations[{idx}].{field}", patterns, changes
-                    )
-            new_locations.append(loc_clean)
-        cleaned["locations"] = new_locations
-
-    npcs = cleaned.get("npcs")
-    if isinstance(npcs, list):
-        new_npcs: List[Any] = []
-        for idx, npc in enumerate(npcs):
-            if not isinstance(npc, dict):
-                new_npcs.append(npc)
-                continue
-            npc_clean = dict(npc)
-            for field in SCRUB_NPC_TEXT_FIELDS:
-                if isinstance(npc_clean.get(field), str):
-                    npc_clean[field] = _scrub_text(
-                        npc_clean[field], f"npcs[{idx}].{field}", patterns, changes
-                    )
-            for field in SCRUB_NPC_LIST_FIELDS:
-                if isinstance(npc_clean.get(field), list):
-                    npc_clean[field] = _scrub_list(
-                        npc_clean[field], f"npcs[{idx}].{field}", patterns, changes
-                    )
-            new_npcs.append(npc_clean)
-        cleaned["npcs"] = new_npcs
-
-    main_quest = cleaned.get("main_quest")
+        bible_clean = _scrub_fields(
+            world_bible,
+            SCRUB_WORLD_BIBLE_TEXT_FIELDS,
+            SCRUB_WORLD_BIBLE_LIST_FIELDS,
+            "world_bible.",
+            patterns,
+            changes,
+        )
+        if bible_clean is not world_bible:
+            updates["world_bible"] = bible_clean
+
+    for name, text_fields, list_fields in (
+        ("locations", SCRUB_LOCATION_TEXT_FIELDS, SCRUB_LOCATION_LIST_FIELDS),
+        ("npcs", SCRUB_NPC_TEXT_FIELDS, SCRUB_NPC_LIST_FIELDS),
+    ):
+        items = data.get(name)
+        if isinstance(items, list):
+            scrubbed = _scrub_items(items, text_fields, list_fields, name, patterns, changes)
+            if scrubbed is not items:
+                updates[name] = scrubbed
+
+    main_quest = data.get("main_quest")
     if isinstance(main_quest, dict):
-        q_clean = dict(main_quest)
-        for field in SCRUB_QUEST_TEXT_FIELDS:
-            if isinstance(q_clean.get(field), str):
-                q_clean[field] = _scrub_text(q_clean[field], f"main_quest.{field}", patterns, changes)
-        cleaned["main_quest"] = q_clean
+        quest_clean = _scrub_fields(main_quest, SCRUB_QUEST_TEXT_FIELDS, (), "main_quest.", patterns, changes)
+        if quest_clean is not main_quest:
+            updates["main_quest"] = quest_clean
 
-    side_quests = cleaned.get("side_quests")
+    side_quests = data.get("side_quests")
     if isinstance(side_quests, list):
-        new_quests: List[Any] = []
-        for idx, quest in enumerate(side_quests):
-            if not isinstance(quest, dict):
-                new_quests.append(quest)
-                continue
-            q_clean = dict(quest)
-            for field in SCRUB_QUEST_TEXT_FIELDS:
-                if isinstance(q_clean.get(field), str):
-                    q_clean[field] = _scrub_text(
-                        q_clean[field], f"side_quests[{idx}].{field}", patterns, changes
-                    )
-            new_quests.append(q_clean)
-        cleaned["side_quests"] = new_quests
+        scrubbed = _scrub_items(side_quests, SCRUB_QUEST_TEXT_FIELDS, (), "side_quests", patterns, changes)
+        if scrubbed is not side_quests:
+            updates["side_quests"] = scrubbed
 
-    return cleaned, changes
+    if not updates:
+        return data, changes
+    return {**data, **updates}, changes
+
+
+def _scrub_items(
+    items: List[Any],
+    text_fields: frozenset[str] | Tuple[str, ...],
+    list_fields: frozenset[str] | Tuple[str, ...],
+    name: str,
+    patterns: _BannedPatterns,
+    changes: List[str],
+) -> List[Any]:
+    scrubbed = [
+        _scrub_fields(item, text_fields, list_fields, f"{name}[{idx}].", patterns, changes)
+        if isinstance(item, dict)
+        else item
+        for idx, item in enumerate(items)
+    ]
+    if all(new is old for new, old in zip(scrubbed, items)):
+        return items
+    return scrubbed
+
+
+def _scrub_fields(
+    item: Dict[str, Any],
+    text_fields: frozenset[str] | Tuple[str, ...],
+    list_fields: frozenset[str] | Tuple[str, ...],
+    prefix: str,
+    patterns: _BannedPatterns,
+    changes: List[str],
+) -> Dict[str, Any]:
+    # Copy-on-write: the input dict is returned as-is unless a field changed.
+    updates: Dict[str, Any] = {}
+    for field in text_fields:
+        value = item.get(field)
+        if isinstance(value, str):
+            scrubbed = _scrub_text(value, f"{prefix}{field}", patterns, changes)
+            if scrubbed != value:
+                updates[field] = scrubbed
+    for field in list_fields:
+        value = item.get(field)
+        if isinstance(value, list):
+            scrubbed_list = _scrub_list(value, f"{prefix}{field}", patterns, changes)
+            if scrubbed_list != value:
+                updates[field] = scrubbed_list
+    if not updates:
+        return item
+    return {**item, **updates}
 
 
 def _coerce_str_list(value: Any) -> List[str]:
@@ -332,12 +349,18 @@ def _coerce_str_list(value: Any) -> List[str]:
         if not text:
             return []
         if "," in text:
-            return [part.strip() for part in text.split(",") if part.strip()]
+            return [part for part in (piece.strip() for piece in text.split(",")) if part]
         return [text]
     return []
 
 
 def _parse_number(value: Any) -> float | None:
+    # Exact-type checks first: LLM JSON numbers arrive as plain int/float.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if isinstance(value, bool):
         return None
     if isinstance(value, (int, float)):
@@ -352,7 +375,7 @@ def _parse_number(value: Any) -> float | None:
             except ValueError:
                 return None
         text = text.replace(",", "")
-        match = re.search(r"-?\d+(?:\.\d+)?", text)
+        match = _NUM_RE.search(text)
         if match:
             try:
                 return float(match.group(0))
@@ -362,36 +385,59 @@ def _parse_number(value: Any) -> float | None:
 
 
 def _to_float(value: Any) -> Any:
+    if type(value) in (float, int):
+        return round(float(value), 3)
     parsed = _parse_number(value)
     if parsed is None:
         return value
     return round(parsed, 3)
 
 
-def _build_banned_patterns(banned: List[str]) -> List[Tuple[str, re.Pattern]]:
-    patterns: List[Tuple[str, re.Pattern]] = []
+@lru_cache(maxsize=64)
+def _build_banned_patterns(banned: Tuple[str, ...]) -> _BannedPatterns:
+    # One case-insensitive alternation; group t<i> maps a hit back to banned[i].
+    terms: List[str] = []
+    groups: List[str] = []
+    probes: Dict[str, None] = {}
     for term in banned:
-        lowered = term.lower()
-        if " " in lowered:
-            parts = [re.escape(part) for part in lowered.split()]
-            body = r"[-\s]+".join(parts)
-        else:
-            body = re.escape(lowered)
-        patterns.append((term, re.compile(rf"\b{body}\b")))
-    return patterns
+        words = term.lower().split()
+        if not words:
+            continue
+        body = r"[-\s]+".join(re.escape(word) for word in words)
+        groups.append(rf"(?P<t{len(terms)}>{body})")
+        terms.append(term)
+        # Any match must contain the first word, whatever separates the rest.
+        probes[fold_case(words[0])] = None
+    if not groups:
+        return _NO_BANNED
+    combined = re.compile(rf"\b(?:{'|'.join(groups)})\b", re.IGNORECASE)
+    return _BannedPatterns(terms=tuple(terms), combined=combined, probes=tuple(probes))
 
 
 def _sanitize_quest(quest: Dict[str, Any], changes: List[str], prefix: str) -> Dict[str, Any]:
-    quest_clean: Dict[str, Any] = {}
-    for key, value in quest.items():
-        if key in QUEST_FIELDS:
-            if key in {"required_items", "reward_items"}:
-                quest_clean[key] = _coerce_item_map(value)
-            else:
-                quest_clean[key] = value
+    return _clean_fields(quest, _QUEST_HANDLERS, changes, prefix, f"drop_{prefix}")
+
+
+def _clean_fields(
+    item: Dict[str, Any],
+    handlers: Dict[str, Any],
+    changes: List[str],
+    path: str,
+    drop_prefix: str,
+) -> Dict[str, Any]:
+    # Keys missing from the table are dropped; a None handler keeps the value as-is.
+    cleaned: Dict[str, Any] = {}
+    lookup = handlers.get
+    drop = _DROP
+    for key, value in item.items():
+        handler = lookup(key, drop)
+        if handler is None:
+            cleaned[key] = value
+        elif handler is drop:
+            changes.append(f"{drop_prefix}:{key}")
         else:
-            changes.append(f"drop_{prefix}:{key}")
-    return quest_clean
+            cleaned[key] = handler(value, changes, path, key)
+    return cleaned
 
 
 def _coerce_item_map(value: Any) -> Dict[str, int]:
@@ -425,19 +471,27 @@ def _coerce_item_map(value: Any) -> Dict[str, int]:
     return {}
 
 
-def _scrub_text(text: str, path: str, patterns: List[Tuple[str, re.Pattern]], changes: List[str]) -> str:
-    updated = text
-    removed: List[str] = []
-    for term, pattern in patterns:
-        if pattern.search(updated.lower()):
-            updated = pattern.sub("forbidden item", updated)
-            removed.append(term)
-    if removed and updated != text:
+def _scrub_text(text: str, path: str, patterns: _BannedPatterns, changes: List[str]) -> str:
+    combined = patterns.combined
+    if combined is None:
+        return text
+    folded = fold_case(text)
+    if not any(probe in folded for probe in patterns.probes) or combined.search(text) is None:
+        return text
+    hits: set[int] = set()
+
+    def _replace(match: re.Match) -> str:
+        hits.add(int(match.lastgroup[1:]))
+        return "forbidden item"
+
+    updated = combined.sub(_replace, text)
+    if hits and updated != text:
+        removed = [patterns.terms[idx] for idx in sorted(hits)]
         changes.append(f"scrub:{path}:{','.join(removed)}")
     return updated
 
 
-def _scrub_list(values: List[Any], path: str, patterns: List[Tuple[str, re.Pattern]], changes: List[str]) -> List[Any]:
+def _scrub_list(values: List[Any], path: str, patterns: _BannedPatterns, changes: List[str]) -> List[Any]:
     updated: List[Any] = []
     for idx, item in enumerate(values):
         if isinstance(item, str):
@@ -449,7 +503,7 @@ def _scrub_list(values: List[Any], path: str, patterns: List[Tuple[str, re.Patte
     return updated
 
 
-def _normalize_unit(value: Any, changes: List[str], path: str) -> Any:
+def _normalize_unit(value: Any, changes: List[str], path: str, key: str) -> Any:
     original = value
     parsed = _parse_number(value)
     if parsed is None and isinstance(value, str):
@@ -457,70 +511,96 @@ def _normalize_unit(value: Any, changes: List[str], path: str) -> Any:
     if parsed is None:
         return value
 
-    normalized = parsed
-    if normalized > 1.0:
-        if normalized <= 10.0:
-            normalized = normalized / 10.0
-        elif normalized <= 100.0:
-            normalized = normalized / 100.0
-    if normalized < 0.0:
-        normalized = 0.0
-    if normalized > 1.0:
-        normalized = 1.0
-    normalized = round(normalized, 3)
-
+    normalized = _scale_unit(parsed)
     if normalized != original:
-        changes.append(f"{path}:{original}->{normalized}")
+        changes.append(f"{path}.{key}:{original}->{normalized}")
     return normalized
 
 
-def _normalize_disposition(value: Any, changes: List[str], path: str) -> Any:
+def _normalize_disposition(value: Any, changes: List[str], path: str, key: str) -> Any:
     original = value
     parsed = _parse_number(value)
     if parsed is None and isinstance(value, str):
         text = value.strip().lower()
-        scores = [score for key, score in DISPOSITION_KEYWORDS.items() if key in text]
-        if scores:
-            parsed = sum(scores) / len(scores)
+        hits = set(_DISP_RE.findall(text))
+        if hits:
+            parsed = sum(DISPOSITION_KEYWORDS[word] for word in hits) / len(hits)
     if parsed is None:
         return value
 
-    normalized = parsed
-    if normalized > 5.0 or normalized < -5.0:
-        if 0.0 <= normalized <= 10.0:
-            normalized = normalized - 5.0
-        elif -10.0 <= normalized <= 10.0:
-            normalized = normalized / 2.0
-    normalized = int(round(normalized))
-    if normalized > 5:
-        normalized = 5
-    if normalized < -5:
-        normalized = -5
-
+    normalized = _scale_disposition(parsed)
     if normalized != original:
-        changes.append(f"{path}:{original}->{normalized}")
+        changes.append(f"{path}.{key}:{original}->{normalized}")
     return normalized
 
 
-def _normalize_narrative_language(value: Any, changes: List[str], path: str) -> str | None:
+def _scale_unit(number: float) -> float:
+    # 0..10 and 0..100 scales are folded onto 0..1, then clamped.
+    if number > 1.0:
+        if number <= 10.0:
+            number /= 10.0
+        elif number <= 100.0:
+            number /= 100.0
+    return round(min(max(number, 0.0), 1.0), 3)
+
+
+def _scale_disposition(number: float) -> int:
+    # 0..10 and -10..10 scales are folded onto -5..5, then clamped.
+    if number > 5.0 or number < -5.0:
+        if 0.0 <= number <= 10.0:
+            number -= 5.0
+        elif -10.0 <= number <= 10.0:
+            number /= 2.0
+    return min(max(int(round(number)), -5), 5)
+
+
+def _normalize_narrative_language(value: Any, changes: List[str], path: str, key: str) -> str | None:
     if value is None:
         return None
     text = str(value).strip().lower()
-    mapping = {
-        "zh": "zh",
-        "zh-cn": "zh",
-        "zh_hans": "zh",
-        "chinese": "zh",
-        "中文": "zh",
-        "cn": "zh",
-        "en": "en",
-        "en-us": "en",
-        "english": "en",
-        "英文": "en",
-    }
-    normalized = mapping.get(text)
+    normalized = _NARR_LANG_MAP.get(text)
     if normalized is None:
         return None
     if normalized != value:
-        changes.append(f"{path}:{value}->{normalized}")
+        changes.append(f"{path}.{key}:{value}->{normalized}")
     return normalized
+
+
+def _str_list_field(value: Any, changes: List[str], path: str, key: str) -> List[str]:
+    return _coerce_str_list(value)
+
+
+def _item_map_field(value: Any, changes: List[str], path: str, key: str) -> Dict[str, int]:
+    return _coerce_item_map(value)
+
+
+def _coord_field(value: Any, changes: List[str], path: str, key: str) -> Any:
+    return _to_float(value)
+
+
+# Field name -> normalizer(value, changes, path, key) for each nested container.
+# The "path.key" label is only formatted when a change is actually recorded.
+_DROP = object()
+_WORLD_BIBLE_HANDLERS = {
+    **dict.fromkeys(WORLD_BIBLE_FIELDS),
+    **dict.fromkeys(_WB_LIST_FIELDS, _str_list_field),
+    "narrative_language": _normalize_narrative_language,
+}
+_LOCATION_HANDLERS = {
+    **dict.fromkeys(LOCATION_FIELDS),
+    **dict.fromkeys(_LOC_LIST_FIELDS, _str_list_field),
+}
+_NPC_HANDLERS = {
+    **dict.fromkeys(NPC_FIELDS),
+    **dict.fromkeys(_NPC_LIST_FIELDS, _str_list_field),
+    **dict.fromkeys(_NPC_UNIT_FIELDS, _normalize_unit),
+    "disposition_to_player": _normalize_disposition,
+}
+_QUEST_HANDLERS = {
+    **dict.fromkeys(QUEST_FIELDS),
+    **dict.fromkeys(_QUEST_ITEM_FIELDS, _item_map_field),
+}
+_MAP_LAYOUT_HANDLERS = {
+    **dict.fromkeys(MAP_LAYOUT_FIELDS),
+    **dict.fromkeys(_MAP_COORD_FIELDS, _coord_field),
+}
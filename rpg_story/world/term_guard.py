@@ -1,7 +1,8 @@
 """Guard against first-mention anachronisms in NPC output."""
 from __future__ import annotations
 
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Set, Tuple
 import re
 
 DEFAULT_ANACHRONISM_TERMS = [
@@ -21,42 +22,53 @@ DEFAULT_ANACHRONISM_TERMS = [
     "electricity",
 ]
 
+_TEXT_SEPARATOR = "\n\x00\n"
+_ALNUM_RE = re.compile(r"[a-z0-9]+")
+# re.IGNORECASE lets ASCII "i" match dotless/dotted capital I, which casefold() alone does not map to "i".
+_FOLD_FIXES = str.maketrans({"\u0131": "i", "\u0130": "i"})
+
 _NORMALIZE_MAP = {
     "wi-fi": "wifi",
     "wifi": "wifi",
 }
 
 
-def extract_terms(text: str, terms: list[str]) -> Set[str]:
+def fold_case(text: str) -> str:
+    """Casefold text so every string an re.IGNORECASE pattern matches contains the folded needle."""
+    return text.translate(_FOLD_FIXES).casefold()
+
+
+def extract_terms(text: str, terms: list[str]) -> FrozenSet[str]:
     if not text:
-        return set()
-    matches: Set[str] = set()
-    for term in terms:
-        if not term:
-            continue
-        normalized = _normalize_term(term)
-        if normalized == "wifi":
-            if re.search(r"\bwi[-\s]?fi\b", text, flags=re.IGNORECASE):
-                matches.add("wifi")
-            continue
-        if _is_alnum(term):
-            pattern = re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
-            if pattern.search(text):
-                matches.add(normalized)
-        else:
-            if term.lower() in text.lower():
-                matches.add(normalized)
-    return matches
+        return frozenset()
+    return _extract_cached(text, terms if isinstance(terms, tuple) else tuple(terms))
 
 
-def detect_first_mention(player_text: str, npc_texts: list[str], terms: list[str]) -> Set[str]:
-    player_terms = extract_terms(player_text, terms)
-    npc_terms: Set[str] = set()
-    for text in npc_texts:
-        npc_terms |= extract_terms(text, terms)
+def detect_first_mention(player_text: str, npc_texts: list[str], terms: list[str]) -> FrozenSet[str]:
+    term_key = tuple(terms)
+    player_terms = extract_terms(player_text, term_key)
+    # No term contains the separator, and it is non-word on both sides, so nothing matches across texts.
+    npc_terms = extract_terms(_TEXT_SEPARATOR.join(npc_texts), term_key)
     return npc_terms - player_terms
 
 
+@lru_cache(maxsize=256)
+def _extract_cached(text: str, terms: Tuple[str, ...]) -> FrozenSet[str]:
+    # The player text is checked again on every rewrite pass, so repeats are common.
+    word_re, labels, substrings, probes = _compile_terms(terms)
+    # Cheap substring screen: most turns mention no term at all, so skip the regex entirely.
+    folded = fold_case(text)
+    if not any(probe in folded for probe in probes):
+        return frozenset()
+    matches: Set[str] = set()
+    if word_re is not None:
+        matches.update(labels[int(match.lastgroup[1:])] for match in word_re.finditer(text))
+    if substrings:
+        lowered = text.lower()
+        matches.update(normalized for needle, normalized in substrings if needle in lowered)
+    return frozenset(matches)
+
+
 def _normalize_term(term: str) -> str:
     lowered = term.lower()
     return _NORMALIZE_MAP.get(lowered, lowered)
@@ -64,4 +76,35 @@ def _normalize_term(term: str) -> str:
 
 def _is_alnum(term: str) -> bool:
     lowered = term.lower()
-    return re.fullmatch(r"[a-z0-9]+", lowered) is not None
+    return _ALNUM_RE.fullmatch(lowered) is not None
+
+
+@lru_cache(maxsize=32)
+def _compile_terms(
+    terms: Tuple[str, ...],
+) -> Tuple[re.Pattern[str] | None, Tuple[str, ...], Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    # Whole-word terms (and wi-fi spellings) share one alternation; group t<i> maps to labels[i].
+    # Other terms stay plain substring checks against the lowered text.
+    # probes are folded substrings that any match must contain, used to screen text up front.
+    groups: list[str] = []
+    labels: list[str] = []
+    substrings: dict[str, str] = {}
+    probes: dict[str, None] = {}
+    for term in terms:
+        if not term:
+            continue
+        normalized = _normalize_term(term)
+        if normalized == "wifi":
+            body = r"wi[-\s]?fi"
+            probes["wi"] = None
+        elif _is_alnum(term):
+            body = re.escape(term)
+            probes[fold_case(term)] = None
+        else:
+            substrings[term.lower()] = normalized
+            probes[fold_case(term)] = None
+            continue
+        groups.append(f"(?P<t{len(labels)}>{body})")
+        labels.append(normalized)
+    word_re = re.compile(rf"\b(?:{'|'.join(groups)})\b", re.IGNORECASE) if groups else None
+    return word_re, tuple(labels), tuple(substrings.items()), tuple(probes)
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+
+from rpg_story.config import load_config
+
+
+@pytest.fixture(scope="session")
+def cfg():
+    # AppConfig is a frozen dataclass, so one load can be shared by every test.
+    return load_config("configs/config.yaml")
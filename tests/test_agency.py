@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
-from rpg_story.config import load_config
+import pytest
+
 from rpg_story.engine.agency import decide_npc_move, apply_agency_gate
 from rpg_story.engine.orchestrator import TurnPipeline
 from rpg_story.llm.client import MockLLMClient
@@ -77,9 +78,18 @@ def make_state(world: WorldSpec) -> GameState:
     )
 
 
-def test_decision_deterministic():
-    world = make_world()
-    state = make_state(world)
+@pytest.fixture(scope="module")
+def world() -> WorldSpec:
+    # Read-only across tests; nothing in the agency gate or pipeline mutates the WorldSpec.
+    return make_world()
+
+
+@pytest.fixture
+def state(world: WorldSpec) -> GameState:
+    return make_state(world)
+
+
+def test_decision_deterministic(world, state):
     move = NPCMove(
         npc_id="npc_obedient",
         from_location="shop",
@@ -94,9 +104,7 @@ def test_decision_deterministic():
     assert first == second
 
 
-def test_stubborn_refuses_obedient_accepts():
-    world = make_world()
-    state = make_state(world)
+def test_stubborn_refuses_obedient_accepts(world, state):
     stubborn_move = NPCMove(
         npc_id="npc_stubborn",
         from_location="shop",
@@ -121,9 +129,7 @@ def test_stubborn_refuses_obedient_accepts():
     assert obedient_decision["allowed"] is True
 
 
-def test_risky_destination_refusal():
-    world = make_world()
-    state = make_state(world)
+def test_risky_destination_refusal(world, state):
     move = NPCMove(
         npc_id="npc_stubborn",
         from_location="shop",
@@ -138,11 +144,8 @@ def test_risky_destination_refusal():
     assert "risk" in decision["tags"] or "role" in decision["tags"]
 
 
-def test_orchestrator_applies_agency_gate(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_applies_agency_gate(world, state, cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
-    world = make_world()
-    state = make_state(world)
 
     output_json = (
         "{"
@@ -186,9 +189,7 @@ def test_orchestrator_applies_agency_gate(tmp_path: Path):
     assert refusals[0]["npc_id"] == "npc_stubborn"
 
 
-def test_agency_accepts_explicit_npc_yes():
-    world = make_world()
-    state = make_state(world)
+def test_agency_accepts_explicit_npc_yes(world, state):
     move = NPCMove(
         npc_id="npc_stubborn",
         from_location="shop",
@@ -209,9 +210,7 @@ def test_agency_accepts_explicit_npc_yes():
     assert not refusals
 
 
-def test_agency_forced_move_on_coercion():
-    world = make_world()
-    state = make_state(world)
+def test_agency_forced_move_on_coercion(world, state):
     move = NPCMove(
         npc_id="npc_stubborn",
         from_location="shop",
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
-from datetime import datetime, timezone
+from functools import lru_cache
 
-from rpg_story.config import load_config
 from rpg_story.engine.orchestrator import TurnPipeline
 from rpg_story.llm.client import MockLLMClient
 from rpg_story.models.world import WorldBibleRules, LocationSpec, NPCProfile, WorldSpec, GameState, QuestSpec
@@ -11,7 +10,11 @@ from rpg_story.persistence.store import load_state, read_turn_logs
 from rpg_story.world.generator import initialize_game_state
 
 
-def make_world() -> WorldSpec:
+_CREATED_AT = "2025-01-01T00:00:00Z"
+
+
+@lru_cache(maxsize=1)
+def _world_template() -> WorldSpec:
     locations = [
         LocationSpec(
             location_id="shop",
@@ -54,7 +57,13 @@ def make_world() -> WorldSpec:
     )
 
 
-def make_world_with_quest_grounding() -> WorldSpec:
+def make_world() -> WorldSpec:
+    # Validate the template once; tests mutate the state's world, so hand out copies.
+    return _world_template().model_copy(deep=True)
+
+
+@lru_cache(maxsize=1)
+def _grounded_world_template() -> WorldSpec:
     locations = [
         LocationSpec(
             location_id="town",
@@ -141,14 +150,17 @@ def make_world_with_quest_grounding() -> WorldSpec:
     )
 
 
-def test_orchestrator_single_turn(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def make_world_with_quest_grounding() -> WorldSpec:
+    return _grounded_world_template().model_copy(deep=True)
+
+
+def test_orchestrator_single_turn(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
 
     world = make_world()
     state = GameState(
         session_id="sess_test",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
@@ -211,14 +223,13 @@ def test_orchestrator_single_turn(tmp_path: Path):
         assert output.npc_dialogue
 
 
-def test_orchestrator_safety_bool_normalized(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_safety_bool_normalized(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
 
     world = make_world()
     state = GameState(
         session_id="sess_test2",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
@@ -246,14 +257,13 @@ def test_orchestrator_safety_bool_normalized(tmp_path: Path):
     assert output.safety.refuse is False
 
 
-def test_turnoutput_quest_updates_list_normalized(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_turnoutput_quest_updates_list_normalized(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
 
     world = make_world()
     state = GameState(
         session_id="sess_test3",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
@@ -281,8 +291,7 @@ def test_turnoutput_quest_updates_list_normalized(tmp_path: Path):
     assert output.world_updates.quest_updates == {}
 
 
-def test_orchestrator_repairs_npc_item_request_to_assigned_side_quest(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_repairs_npc_item_request_to_assigned_side_quest(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
     world = make_world_with_quest_grounding()
     state = initialize_game_state(world, session_id="sess_grounding")
@@ -323,13 +332,12 @@ def test_orchestrator_repairs_npc_item_request_to_assigned_side_quest(tmp_path:
     assert "npc_assigned_quests" in llm.last_user_prompt
 
 
-def test_orchestrator_prompt_forbids_nonquest_npc_collection_request(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_prompt_forbids_nonquest_npc_collection_request(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
     world = make_world()
     state = GameState(
         session_id="sess_nonquest_prompt",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
@@ -356,13 +364,12 @@ def test_orchestrator_prompt_forbids_nonquest_npc_collection_request(tmp_path: P
     assert "During normal conversation, do not keep steering the topic back to quests or tasks." in llm.last_user_prompt
 
 
-def test_orchestrator_repairs_nonquest_npc_collection_request(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_repairs_nonquest_npc_collection_request(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
     world = make_world()
     state = GameState(
         session_id="sess_nonquest_repair",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
@@ -401,13 +408,12 @@ def test_orchestrator_repairs_nonquest_npc_collection_request(tmp_path: Path):
     assert "npc_assigned_quests=[]" in llm.last_user_prompt
 
 
-def test_orchestrator_applies_personality_drift(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_applies_personality_drift(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
     world = make_world()
     state = GameState(
         session_id="sess_personality",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
@@ -450,13 +456,12 @@ def test_orchestrator_applies_personality_drift(tmp_path: Path):
     assert output.world_updates.npc_personality_updates
 
 
-def test_orchestrator_personality_drift_uses_confidence_blending(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_personality_drift_uses_confidence_blending(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
     world = make_world()
     state = GameState(
         session_id="sess_personality_blend",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="shop",
         npc_locations={"npc_1": "shop"},
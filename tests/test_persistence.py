@@ -14,6 +14,8 @@ from rpg_story.persistence.store import (
     validate_session_id,
 )
 
+_SESSION_ID_FORMAT_RE = re.compile(r"\d{8}_\d{6}_[0-9a-f]{6,8}")
+
 
 def make_min_world() -> WorldSpec:
     locs = [
@@ -93,8 +95,7 @@ def test_append_turn_log_multiple_lines(tmp_path: Path):
     for i in range(3):
         append_turn_log(session_id, {"turn_id": i}, sessions_root)
     path = sessions_root / session_id / "turns.jsonl"
-    lines = path.read_text(encoding="utf-8").strip().split("\n")
-    assert len(lines) == 3
+    assert path.read_bytes().count(b"\n") == 3
     records = read_turn_logs(session_id, sessions_root)
     assert [r["turn_id"] for r in records] == [0, 1, 2]
 
@@ -106,26 +107,44 @@ def test_load_missing_raises(tmp_path: Path):
         load_state(session_id, sessions_root)
 
 
+def test_load_invalid_json_raises_value_error(tmp_path: Path):
+    sessions_root = tmp_path / "sessions"
+    session_id = "sess_corrupt"
+    state_path = sessions_root / session_id / "state.json"
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError, match="invalid JSON"):
+        load_state(session_id, sessions_root)
+
+
 def test_read_turn_logs_skips_corrupt_lines(tmp_path: Path):
     sessions_root = tmp_path / "sessions"
     session_id = generate_session_id()
     log_path = sessions_root / session_id / "turns.jsonl"
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_path.write_text(
-        "{\"turn_id\": 1}\n" + "{bad json}\n" + "{\"turn_id\": 2}\n",
-        encoding="utf-8",
-    )
+    log_path.write_bytes(b'{"turn_id": 1}\n{bad json}\n{"turn_id": 2}\n')
+    records = read_turn_logs(session_id, sessions_root)
+    assert [r["turn_id"] for r in records] == [1, 2]
+
+
+def test_read_turn_logs_skips_undecodable_lines(tmp_path: Path):
+    sessions_root = tmp_path / "sessions"
+    session_id = generate_session_id()
+    log_path = sessions_root / session_id / "turns.jsonl"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path.write_bytes(b'{"turn_id": 1}\n{"text": "\xff\xfe"}\n{"turn_id": 2, "text": "\xe4\xbd\xa0"}\n')
     records = read_turn_logs(session_id, sessions_root)
     assert [r["turn_id"] for r in records] == [1, 2]
+    assert records[1]["text"] == "你"
 
 
 def test_session_id_format():
     session_id = generate_session_id()
-    assert re.match(r"^\d{8}_\d{6}_[0-9a-f]{6,8}$", session_id)
+    assert _SESSION_ID_FORMAT_RE.fullmatch(session_id)
 
 
 def test_invalid_session_id_rejected():
-    bad_ids = ["../x", "..\\x", "a/b", "a\\b", "", "a..b", "a b", "💥"]
+    bad_ids = ["../x", "..\\x", "a/b", "a\\b", "", "a..b", "a b", "💥", "abc\n"]
     for sid in bad_ids:
         with pytest.raises(ValueError):
             validate_session_id(sid)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from functools import lru_cache
 
 from rpg_story.engine.state import (
     apply_turn_output,
@@ -21,7 +21,19 @@ from rpg_story.models.world import (
 from rpg_story.world.generator import initialize_game_state
 
 
-def _world_with_quest(required: int = 2) -> WorldSpec:
+_CREATED_AT = "2025-01-01T00:00:00Z"
+
+# Common header of the hand-built main_healing journal entries.
+_MAIN_HEALING_ACTIVE = {
+    "quest_id": "main_healing",
+    "title": "Village Remedy",
+    "category": "main",
+    "status": "active",
+}
+
+
+@lru_cache(maxsize=None)
+def _world_template(required: int) -> WorldSpec:
     locations = [
         LocationSpec(
             location_id="town",
@@ -76,6 +88,11 @@ def _world_with_quest(required: int = 2) -> WorldSpec:
     )
 
 
+def _world_with_quest(required: int = 2) -> WorldSpec:
+    # Validate each variant once; several tests mutate the world, so hand out copies.
+    return _world_template(required).model_copy(deep=True)
+
+
 def _empty_turn(inventory_delta: dict[str, int], quest_updates: list[dict] | None = None) -> TurnOutput:
     return TurnOutput.model_validate(
         {
@@ -106,16 +123,13 @@ def test_apply_turn_inventory_advances_and_completes_quest() -> None:
     world = _world_with_quest(required=2)
     state = GameState(
         session_id="sess_progress",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="town",
         npc_locations={"npc_herbalist": "town"},
         quest_journal={
             "main_healing": {
-                "quest_id": "main_healing",
-                "title": "Village Remedy",
-                "category": "main",
-                "status": "active",
+                **_MAIN_HEALING_ACTIVE,
                 "objective": "Collect healing herbs.",
                 "required_items": {"healing_herb": 2},
                 "collected_items": {"healing_herb": 0},
@@ -159,40 +173,13 @@ def test_legacy_quest_status_is_normalized() -> None:
 
 
 def test_side_quest_completion_grants_reward_then_main_needs_delivery() -> None:
-    locations = [
-        LocationSpec(
-            location_id="town",
-            name="Town",
-            kind="town",
-            description="Town square.",
-            connected_to=["forest"],
-        ),
-        LocationSpec(
-            location_id="forest",
-            name="Forest",
-            kind="forest",
-            description="Dense trees.",
-            connected_to=["town"],
-        ),
-    ]
-    npc = NPCProfile(
-        npc_id="npc_herbalist",
-        name="Mila",
-        profession="Herbalist",
-        traits=["careful"],
-        goals=["heal villagers"],
-        starting_location="forest",
-        obedience_level=0.7,
-        stubbornness=0.3,
-        risk_tolerance=0.4,
-        disposition_to_player=1,
-        refusal_style="calm",
-    )
+    base = _world_with_quest()
+    npc = base.npcs[0].model_copy(update={"starting_location": "forest"})
     world = WorldSpec(
         world_id="world_chain",
         title="Quest Chain",
-        world_bible=WorldBibleRules(tech_level="medieval", magic_rules="low", tone="grounded"),
-        locations=locations,
+        world_bible=base.world_bible,
+        locations=base.locations,
         npcs=[npc],
         starting_location="town",
         starting_hook="A village lacks medicine.",
@@ -225,7 +212,7 @@ def test_side_quest_completion_grants_reward_then_main_needs_delivery() -> None:
     )
     state = GameState(
         session_id="sess_chain",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="forest",
         npc_locations={"npc_herbalist": "forest"},
@@ -291,7 +278,7 @@ def test_delivery_matches_item_alias_between_languages() -> None:
     world = _world_with_quest(required=1)
     state = GameState(
         session_id="sess_alias",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="town",
         npc_locations={"npc_herbalist": "town"},
@@ -324,17 +311,14 @@ def test_main_guidance_points_to_realtime_finale_npc_location() -> None:
     world = _world_with_quest(required=1)
     state = GameState(
         session_id="sess_finale_target",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="town",
         npc_locations={"npc_herbalist": "town"},
         inventory={"healing_herb": 1},
         quest_journal={
             "main_healing": {
-                "quest_id": "main_healing",
-                "title": "Village Remedy",
-                "category": "main",
-                "status": "active",
+                **_MAIN_HEALING_ACTIVE,
                 "objective": "Collect healing herbs.",
                 "giver_npc_id": "npc_herbalist",
                 "required_items": {"healing_herb": 1},
@@ -355,16 +339,13 @@ def test_main_trial_readiness_true_when_no_required_items() -> None:
     world = _world_with_quest(required=1)
     state = GameState(
         session_id="sess_no_required",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="town",
         npc_locations={"npc_herbalist": "town"},
         quest_journal={
             "main_healing": {
-                "quest_id": "main_healing",
-                "title": "Village Remedy",
-                "category": "main",
-                "status": "active",
+                **_MAIN_HEALING_ACTIVE,
                 "objective": "Collect healing herbs.",
                 "giver_npc_id": "npc_herbalist",
                 "required_items": {},
@@ -383,17 +364,14 @@ def test_main_progress_tracks_inventory_but_needs_trial_to_complete() -> None:
     world = _world_with_quest(required=2)
     state = GameState(
         session_id="sess_main_progress",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="forest",
         npc_locations={"npc_herbalist": "forest"},
         inventory={"healing_herb": 2},
         quest_journal={
             "main_healing": {
-                "quest_id": "main_healing",
-                "title": "Village Remedy",
-                "category": "main",
-                "status": "active",
+                **_MAIN_HEALING_ACTIVE,
                 "required_items": {"healing_herb": 2},
                 "collected_items": {"healing_herb": 0},
             }
@@ -459,7 +437,7 @@ def test_sync_repairs_mismatched_side_quest_text_against_required_items() -> Non
     world.world_bible.narrative_language = "zh"
     state = GameState(
         session_id="sess_text_repair",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="town",
         npc_locations={"npc_herbalist": "town"},
@@ -487,7 +465,7 @@ def test_chat_turn_cannot_auto_submit_item_delivery_progress() -> None:
     world = _world_with_quest(required=1)
     state = GameState(
         session_id="sess_no_auto_submit",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=_CREATED_AT,
         world=world,
         player_location="town",
         npc_locations={"npc_herbalist": "town"},
@@ -65,6 +65,14 @@ def test_worldspec_valid():
     assert world.world_id == "world_001"
 
 
+def test_worldspec_lookup_by_id():
+    world = make_min_world()
+    assert world.get_location("loc_002").name == "Forest"
+    assert world.get_npc("npc_001").name == "Ala"
+    assert world.get_location("loc_999") is None
+    assert world.get_npc("npc_999") is None
+
+
 def test_worldspec_missing_starting_location():
     world = make_min_world().model_copy()
     world.starting_location = "loc_999"
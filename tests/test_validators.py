@@ -3,7 +3,6 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
-from rpg_story.config import load_config
 from rpg_story.engine.orchestrator import TurnPipeline
 from rpg_story.engine.validators import build_graph, is_reachable, validate_npc_move
 from rpg_story.llm.client import MockLLMClient
@@ -130,8 +129,7 @@ def test_validate_npc_missing():
     assert "npc_id" in reason
 
 
-def test_orchestrator_logs_move_rejections(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_orchestrator_logs_move_rejections(cfg, tmp_path: Path):
     sessions_root = tmp_path / "sessions"
 
     world = make_world()
@@ -4,7 +4,6 @@ from pathlib import Path
 import re
 import json
 
-from rpg_story.config import load_config
 from rpg_story.llm.client import MockLLMClient
 from rpg_story.models.world import WorldSpec, WorldBibleRules, LocationSpec, NPCProfile
 from rpg_story.persistence.store import load_state
@@ -13,8 +12,10 @@ from rpg_story.world.generator import (
     initialize_game_state,
     create_new_session,
     suggest_location_resource_template,
+    _replace_item_mentions_many,
 )
 from rpg_story.world.consistency import find_anachronisms
+from rpg_story.world.sanitize import sanitize_world_payload, scrub_banned_terms
 
 
 def valid_world_json() -> str:
@@ -330,8 +331,7 @@ def _has_ascii_letters(text: str) -> bool:
     return bool(re.search(r"[A-Za-z]", text or ""))
 
 
-def test_generate_world_valid_first():
-    cfg = load_config("configs/config.yaml")
+def test_generate_world_valid_first(cfg):
     llm = MockLLMClient([valid_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     assert isinstance(world, WorldSpec)
@@ -342,8 +342,7 @@ def test_generate_world_valid_first():
     assert llm.last_response_format.get("json_schema", {}).get("name") == "WorldSpec"
 
 
-def test_prompt_language_forces_world_language_with_rewrite():
-    cfg = load_config("configs/config.yaml")
+def test_prompt_language_forces_world_language_with_rewrite(cfg):
     # 1st output intentionally English, 2nd output is localized Chinese rewrite.
     llm = MockLLMClient([valid_world_json(), chinese_world_json()])
     world = generate_world_spec(cfg, llm, "请生成一个中世纪中文世界")
@@ -353,8 +352,7 @@ def test_prompt_language_forces_world_language_with_rewrite():
     assert re.search(r"[\u4e00-\u9fff]", world.initial_quest)
 
 
-def test_prompt_language_rewrites_when_world_is_mostly_english_but_contains_cjk():
-    cfg = load_config("configs/config.yaml")
+def test_prompt_language_rewrites_when_world_is_mostly_english_but_contains_cjk(cfg):
     llm = MockLLMClient([mostly_english_with_single_cjk_json(), chinese_world_json()])
     world = generate_world_spec(cfg, llm, "请用中文生成一个中世纪世界")
     assert world.world_bible.narrative_language == "zh"
@@ -362,15 +360,13 @@ def test_prompt_language_rewrites_when_world_is_mostly_english_but_contains_cjk(
     assert not _has_ascii_letters(world.initial_quest)
 
 
-def test_invalid_connected_to_triggers_rewrite():
-    cfg = load_config("configs/config.yaml")
+def test_invalid_connected_to_triggers_rewrite(cfg):
     llm = MockLLMClient([invalid_connected_world_json(), valid_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     assert world.world_id == "world_001"
 
 
-def test_banned_keyword_triggers_rewrite():
-    cfg = load_config("configs/config.yaml")
+def test_banned_keyword_triggers_rewrite(cfg):
     llm = MockLLMClient([banned_world_json(), valid_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     assert world.world_id == "world_001"
@@ -494,15 +490,13 @@ def test_anachronism_detection_ignores_do_not_mention_only():
     assert not find_anachronisms(world)
 
 
-def test_anachronism_rewrite_removes_keywords():
-    cfg = load_config("configs/config.yaml")
+def test_anachronism_rewrite_removes_keywords(cfg):
     llm = MockLLMClient([banned_world_json(), valid_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     assert not find_anachronisms(world)
 
 
-def test_sanitization_no_rewrite_needed():
-    cfg = load_config("configs/config.yaml")
+def test_sanitization_no_rewrite_needed(cfg):
     llm = MockLLMClient([dirty_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     assert world.world_id == "world_dirty"
@@ -511,8 +505,7 @@ def test_sanitization_no_rewrite_needed():
     assert -5 <= npc.disposition_to_player <= 5
 
 
-def test_sanitization_live_like_payload():
-    cfg = load_config("configs/config.yaml")
+def test_sanitization_live_like_payload(cfg):
     llm = MockLLMClient([live_like_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     assert world.world_id == "world_live_like"
@@ -523,8 +516,7 @@ def test_sanitization_live_like_payload():
         assert -5 <= npc.disposition_to_player <= 5
 
 
-def test_initialize_game_state_full_coverage():
-    cfg = load_config("configs/config.yaml")
+def test_initialize_game_state_full_coverage(cfg):
     llm = MockLLMClient([valid_world_json()])
     world = generate_world_spec(cfg, llm, "A simple world")
     state = initialize_game_state(world, session_id="sess_x")
@@ -534,8 +526,7 @@ def test_initialize_game_state_full_coverage():
     assert len(keys) >= 2
 
 
-def test_create_new_session_persists_files(tmp_path: Path):
-    cfg = load_config("configs/config.yaml")
+def test_create_new_session_persists_files(cfg, tmp_path: Path):
     llm = MockLLMClient([valid_world_json()])
     sessions_root = tmp_path / "sessions"
     worlds_root = tmp_path / "worlds"
@@ -554,8 +545,7 @@ def test_create_new_session_persists_files(tmp_path: Path):
     assert loaded.world.world_id == world.world_id
 
 
-def test_chinese_world_localizes_items_and_dedupes_npc_names():
-    cfg = load_config("configs/config.yaml")
+def test_chinese_world_localizes_items_and_dedupes_npc_names(cfg):
     llm = MockLLMClient([chinese_mixed_world_json()])
     world = generate_world_spec(cfg, llm, "中世纪屠龙冒险")
 
@@ -575,8 +565,7 @@ def test_chinese_world_localizes_items_and_dedupes_npc_names():
     assert "Phoenix Feather" not in world.main_quest.objective
 
 
-def test_side_quest_objective_and_title_are_aligned_with_required_items() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_side_quest_objective_and_title_are_aligned_with_required_items(cfg) -> None:
     llm = MockLLMClient([chinese_sidequest_mismatch_json()])
     world = generate_world_spec(cfg, llm, "请生成中文中世纪屠龙世界")
 
@@ -585,8 +574,7 @@ def test_side_quest_objective_and_title_are_aligned_with_required_items() -> Non
     assert "月光草" in side.title
 
 
-def test_campus_world_uses_theme_aware_professions_items_and_resources() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_campus_world_uses_theme_aware_professions_items_and_resources(cfg) -> None:
     llm = MockLLMClient([campus_world_json()])
     world = generate_world_spec(cfg, llm, "请生成校园恋爱主题世界")
 
@@ -615,8 +603,7 @@ def test_campus_world_uses_theme_aware_professions_items_and_resources() -> None
     assert all(item not in {"探险样本", "古铁矿"} for item in stock.keys())
 
 
-def test_main_quest_requires_side_rewards_not_collectible_materials() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_main_quest_requires_side_rewards_not_collectible_materials(cfg) -> None:
     llm = MockLLMClient([campus_world_json()])
     world = generate_world_spec(cfg, llm, "请生成校园恋爱主题世界")
 
@@ -627,8 +614,7 @@ def test_main_quest_requires_side_rewards_not_collectible_materials() -> None:
     assert set(world.main_quest.required_items.keys()).isdisjoint(side_required_items)
 
 
-def test_collectible_item_types_are_diverse_and_location_stock_differs() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_collectible_item_types_are_diverse_and_location_stock_differs(cfg) -> None:
     llm = MockLLMClient([campus_world_json()])
     world = generate_world_spec(cfg, llm, "请生成校园恋爱主题世界")
 
@@ -645,8 +631,7 @@ def test_collectible_item_types_are_diverse_and_location_stock_differs() -> None
     assert len(unique_stock_sets) >= 2
 
 
-def test_bad_npc_identity_is_rewritten_to_non_duplicate_name_and_profession() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_bad_npc_identity_is_rewritten_to_non_duplicate_name_and_profession(cfg) -> None:
     llm = MockLLMClient([bad_npc_identity_world_json()])
     world = generate_world_spec(cfg, llm, "请生成中文中世纪世界")
 
@@ -656,8 +641,7 @@ def test_bad_npc_identity_is_rewritten_to_non_duplicate_name_and_profession() ->
     assert "龙脊山脉" not in bad_npc.profession
 
 
-def test_campus_side_items_are_generated_theme_aligned_in_first_pass() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_campus_side_items_are_generated_theme_aligned_in_first_pass(cfg) -> None:
     llm = MockLLMClient([campus_refined_world_json()])
     world = generate_world_spec(cfg, llm, "请生成校园恋爱主题世界")
 
@@ -668,8 +652,7 @@ def test_campus_side_items_are_generated_theme_aligned_in_first_pass() -> None:
     assert llm.calls == 1
 
 
-def test_ambient_location_resources_use_world_item_pool_not_fabricated_location_tokens() -> None:
-    cfg = load_config("configs/config.yaml")
+def test_ambient_location_resources_use_world_item_pool_not_fabricated_location_tokens(cfg) -> None:
     llm = MockLLMClient([campus_refined_world_json()])
     world = generate_world_spec(cfg, llm, "请生成校园恋爱主题世界")
 
@@ -691,3 +674,49 @@ def test_ambient_location_resources_use_world_item_pool_not_fabricated_location_
     assert stock
     assert all("后山步道" not in name for name in stock.keys())
     assert all(marker not in name for name in stock.keys() for marker in ["遗物", "矿石", "手稿", "样本", "线索"])
+
+
+def test_item_mention_replacement_covers_ignorecase_only_matches() -> None:
+    texts = _replace_item_mentions_many(
+        ["Stolen İnternet device", "Bring the Healing-Herb and a HERB"],
+        {"internet": "scroll", "healing_herb": "moon herb", "herb": "leaf"},
+    )
+
+    assert texts == ["Stolen scroll device", "Bring the moon herb and a leaf"]
+
+
+def test_scrub_banned_terms_is_case_insensitive_and_keeps_original_casing() -> None:
+    payload = {
+        "title": "The Smart-Phone Saga",
+        "npcs": [{"name": "Ada", "traits": ["carries a GUN", "Calm"]}],
+    }
+    cleaned, changes = scrub_banned_terms(payload, ["smart phone", "gun"])
+
+    assert cleaned["title"] == "The forbidden item Saga"
+    assert cleaned["npcs"][0]["traits"] == ["carries a forbidden item", "Calm"]
+    assert changes == ["scrub:title:smart phone", "scrub:npcs[0].traits[0]:gun"]
+    assert payload["title"] == "The Smart-Phone Saga"
+
+
+def test_scrub_banned_terms_matches_dotted_and_dotless_capital_i() -> None:
+    cleaned, changes = scrub_banned_terms(
+        {"title": "Stolen İnternet device", "starting_hook": "ınternet rumors"},
+        ["internet"],
+    )
+
+    assert cleaned["title"] == "Stolen forbidden item device"
+    assert cleaned["starting_hook"] == "forbidden item rumors"
+    assert sorted(changes) == ["scrub:starting_hook:internet", "scrub:title:internet"]
+
+
+def test_sanitize_disposition_keywords_prefer_longest_phrase() -> None:
+    payload = {
+        "npcs": [
+            {"npc_id": "npc_001", "disposition_to_player": "very hostile"},
+            {"npc_id": "npc_002", "disposition_to_player": "friendly but wary"},
+        ]
+    }
+    cleaned, changes = sanitize_world_payload(payload)
+
+    assert [npc["disposition_to_player"] for npc in cleaned["npcs"]] == [-5, 0]
+    assert "npcs[0].disposition_to_player:very hostile->-5" in changes